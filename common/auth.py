@@ -12,10 +12,11 @@ be fully implemented in later commits when the Users service is developed.
 """
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 from common.config import get_settings
@@ -113,22 +114,80 @@ def verify_access_token(token: str) -> dict:
     handling strategy) will be implemented in a later commit.
     """
     
+    return get_jwt_validator().decode(token)
+
+
+class JWTValidator:
+    """
+    Token verifier whose key and decode options are resolved up front.
+
+    The jose key object and decode options are built once in ``__init__``,
+    so :meth:`decode` does no per-call key parsing. Most callers should use
+    the process-wide instance from :func:`get_jwt_validator`.
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        *,
+        algorithm: str,
+        audience: Optional[str] = None,
+        issuer: Optional[str] = None,
+        leeway: int = 0,
+    ) -> None:
+        self._key = jwk.construct(secret_key, algorithm)
+        self._algorithms = [algorithm]
+        self._audience = audience or None
+        self._issuer = issuer or None
+        self._options: Dict[str, Any] = {"verify_aud": bool(audience)}
+        if leeway:
+            self._options["leeway"] = leeway
+
+    def decode(self, token: str) -> dict:
+        """
+        Verify ``token`` and return its payload.
+
+        Raises
+        ------
+        RuntimeError
+            If the token is invalid, expired, or cannot be decoded.
+        """
+        try:
+            return jwt.decode(
+                token,
+                self._key,
+                algorithms=self._algorithms,
+                audience=self._audience,
+                issuer=self._issuer,
+                options=self._options,
+            )
+        except JWTError as exc:
+            raise RuntimeError("Invalid or expired token") from exc
+
+
+def build_jwt_validator() -> JWTValidator:
+    """
+    Build a :class:`JWTValidator` from the current settings.
+    """
     settings = get_settings()
-    try:
-        options = {"verify_aud": bool(settings.jwt_audience)}
-        if settings.jwt_leeway_seconds:
-            options["leeway"] = settings.jwt_leeway_seconds
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-            audience=settings.jwt_audience if settings.jwt_audience else None,
-            issuer=settings.jwt_issuer if settings.jwt_issuer else None,
-            options=options,
-        )
-        return payload
-    except JWTError as exc:  # pragma: no cover - defensive
-        raise RuntimeError("Invalid or expired token") from exc
+    return JWTValidator(
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+        audience=settings.jwt_audience,
+        issuer=settings.jwt_issuer,
+        leeway=settings.jwt_leeway_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_jwt_validator() -> JWTValidator:
+    """
+    Return the process-wide :class:`JWTValidator`, built on first use.
+
+    Every service verifies tokens against the same settings, so they all
+    share this one instance (and :func:`verify_access_token` uses it too).
+    """
+    return build_jwt_validator()
 
 
 def decode_access_token(token: str) -> dict:
@@ -28,6 +28,14 @@ class Settings(BaseSettings):
     database_url:
         SQLAlchemy connection string used by services when they need to
         talk directly to the shared relational database.
+    database_pool_size, database_pool_overflow, database_pool_timeout,
+    database_pool_recycle:
+        Connection pool sizing for server databases (ignored for SQLite).
+        Idle connections are recycled after ``database_pool_recycle``
+        seconds.
+    analytics_database_url:
+        Optional read replica for analytics queries. When unset, analytics
+        read from ``database_url``.
     jwt_secret_key:
         Secret key used to sign JSON Web Tokens.
     jwt_algorithm:
@@ -51,6 +59,11 @@ class Settings(BaseSettings):
     """
 
     database_url: str = "postgresql://postgres:postgres@db:5432/smart_meeting_room"
+    database_pool_size: int = 20
+    database_pool_overflow: int = 30
+    database_pool_timeout: int = 30
+    database_pool_recycle: int = 1800
+    analytics_database_url: Optional[str] = None
     jwt_secret_key: str = "CHANGE_ME_IN_PRODUCTION"
     jwt_algorithm: str = "HS256"
     jwt_issuer: Optional[str] = None
@@ -0,0 +1,30 @@
+"""
+Database engine helpers shared by the services.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from common.config import get_settings
+
+
+def engine_pool_options(url: str) -> Dict[str, Any]:
+    """
+    Return the ``create_engine`` pool arguments for ``url``.
+
+    SQLite gets SQLAlchemy's default pool. Server databases keep a sized LIFO
+    pool, so bursts reuse the most recently returned (still warm)
+    connections, with pre-ping so stale ones are replaced.
+    """
+    if url.startswith("sqlite"):
+        return {}
+    settings = get_settings()
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_pool_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+    }
@@ -12,7 +12,8 @@ observable way.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+import threading
 import time
 from httpx import TimeoutException, HTTPError, Response
 
@@ -20,7 +21,27 @@ import httpx
 
 from common.config import get_settings
 from common.circuit_breaker import get_breaker
-from common.exceptions import DownstreamServiceError, CircuitOpenError
+from common.exceptions import DownstreamServiceError, CircuitOpenError
+
+
+# Pooled httpx clients keyed by (base URL, timeout). ``httpx.Client`` is
+# thread-safe and keeps connections alive, so every ServiceHTTPClient aimed at
+# the same target shares one pool instead of reconnecting per request.
+_CLIENTS: Dict[Tuple[str, float], httpx.Client] = {}
+_CLIENTS_LOCK = threading.Lock()
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+
+
+def _get_pooled_client(base_url: str, timeout: float) -> httpx.Client:
+    key = (base_url, timeout)
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = httpx.Client(base_url=base_url, timeout=timeout, limits=_POOL_LIMITS)
+                _CLIENTS[key] = client
+    return client
 
 
 class ServiceHTTPClient:
@@ -52,13 +73,13 @@ class ServiceHTTPClient:
 
     def _build_client(self) -> httpx.Client:
         """
-        Build a new :class:`httpx.Client` instance.
+        Return the shared :class:`httpx.Client` for this target.
 
-        The client is created on demand to keep this wrapper very simple.
-        Future commits may optimize this to reuse a shared connection
-        pool if required.
+        Clients are pooled per base URL and timeout, so short-lived wrapper
+        instances still reuse keep-alive connections. The pooled client must
+        not be closed by callers.
         """
-        return httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        return _get_pooled_client(self.base_url, self.timeout)
 
     def _do_with_retries(self, method: str, path: str, *, headers: Dict[str, str], **kwargs: Any) -> httpx.Response:
         """
@@ -72,18 +93,18 @@ class ServiceHTTPClient:
 
         while attempt <= retries:
             try:
-                with self._build_client() as client:
-                    breaker = get_breaker(self.service_name)
-                    if settings.cb_enabled:
-                        breaker.before_call()
-                    resp: Response = client.request(method, path, headers=headers, **kwargs)
-                    if resp.status_code >= 500:
-                        if settings.cb_enabled:
-                            breaker.record_failure()
-                        resp.raise_for_status()
+                client = self._build_client()
+                breaker = get_breaker(self.service_name)
+                if settings.cb_enabled:
+                    breaker.before_call()
+                resp: Response = client.request(method, path, headers=headers, **kwargs)
+                if resp.status_code >= 500:
                     if settings.cb_enabled:
-                        breaker.record_success()
-                    return resp
+                        breaker.record_failure()
+                    resp.raise_for_status()
+                if settings.cb_enabled:
+                    breaker.record_success()
+                return resp
             except (TimeoutException, HTTPError) as exc:
                 last_exc = exc
                 attempt += 1
@@ -17,9 +17,10 @@ This module will be responsible for:
 from __future__ import annotations
 
 import time
+from datetime import timedelta
 from typing import Optional, Tuple
 
-from common.auth import create_access_token, verify_access_token
+from common.auth import create_access_token
 from common.config import get_settings
 from common.logging_utils import get_logger
 
@@ -37,17 +38,21 @@ def _generate_token() -> Tuple[str, float]:
     the ``service_account`` role so that inter-service calls can authenticate
     without requiring a live Users login endpoint. The subject is set to ``0``
     to satisfy int conversions in downstream dependencies.
+
+    The expiry is derived from the lifetime we pass in rather than by
+    decoding the token we just signed; taking the timestamp first keeps it a
+    hair early, which only makes the refresh slightly more eager.
     """
     settings = get_settings()
+    lifetime = timedelta(minutes=settings.access_token_expire_minutes)
+    issued_at = time.time()
     token = create_access_token(
         {"username": settings.service_account_username},
         subject="0",
         role="service_account",
-        expires_delta=None,
+        expires_delta=lifetime,
     )
-    payload = verify_access_token(token)
-    exp_ts = payload.get("exp", time.time() + settings.access_token_expire_minutes * 60)
-    return token, float(exp_ts)
+    return token, issued_at + lifetime.total_seconds()
 
 
 def get_service_account_token(force_refresh: bool = False) -> str:
@@ -0,0 +1,38 @@
+"""
+Worker-thread sizing shared by the FastAPI services.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from anyio import to_thread
+from fastapi import FastAPI
+
+from common.config import get_settings
+
+
+def db_worker_threads() -> int:
+    """
+    Return how many threads can usefully hold a database connection at once.
+
+    This is ``pool_size + overflow``, the most connections the engine hands out.
+    """
+    settings = get_settings()
+    return settings.database_pool_size + settings.database_pool_overflow
+
+
+@asynccontextmanager
+async def size_threadpool_to_db_pool(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Lifespan that sizes anyio's worker threadpool to the database pool.
+
+    Sync routes and dependencies run in that threadpool (40 threads by
+    default) and hold a connection while they do. Raising the limit to
+    :func:`db_worker_threads` lets every pooled connection be in use at once,
+    without queueing requests on threads while connections sit idle.
+    """
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, db_worker_threads())
+    yield
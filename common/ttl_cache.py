@@ -0,0 +1,84 @@
+"""
+Small in-memory cache with per-entry expiry, shared by the services.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe mapping whose entries expire after a time-to-live.
+
+    Expiry uses :func:`time.monotonic`. Once ``maxsize`` entries are held,
+    storing a new key evicts the least recently used one.
+
+    :meth:`clear` also bumps :attr:`generation`. A reader that computes a
+    value outside the cache can note the generation first and pass it to
+    :meth:`set`; the store is then skipped if the cache was cleared in
+    between, so a result computed before a write is never kept after it.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.generation = 0
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Return the fresh value stored under ``key``, or ``default``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None, *, generation: Optional[int] = None) -> V:
+        """
+        Store ``value`` under ``key`` and hand it back.
+
+        ``ttl`` overrides the cache default for this entry; a non-positive
+        value skips the store. If ``generation`` is given and the cache has
+        been cleared since it was read, the store is skipped as well.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            if ttl <= 0 or (generation is not None and generation != self.generation):
+                return value
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def pop(self, key: K) -> None:
+        """
+        Forget ``key`` if it is cached.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and start a new generation.
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
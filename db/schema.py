@@ -27,9 +27,11 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
 )
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -108,6 +110,13 @@ class Room(Base):
     status = Column(String(50), nullable=False, default="active")
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
 
+    # Expression indexes matching the Rooms service's case-insensitive
+    # lookups: location equality plus a capacity range, and lookup by name.
+    __table_args__ = (
+        Index("rooms_loc_cap_idx", func.lower(location), capacity),
+        Index("rooms_lower_name_idx", func.lower(name)),
+    )
+
     bookings = relationship("Booking", back_populates="room", cascade="all, delete-orphan")
     reviews = relationship("Review", back_populates="room", cascade="all, delete-orphan")
 
@@ -178,6 +187,15 @@ class Review(Base):
     """
 
     __tablename__ = "reviews"
+    # ``ix_reviews_room_created`` serves the per-room keyset listing (filter by
+    # room, ordered by ``(created_at, id)``) as an index range scan without a
+    # sort step; ``id`` breaks ties between reviews created in the same instant.
+    # ``ix_reviews_room_rating`` covers the per-room rating aggregate, so it
+    # is answered from the index without touching the table.
+    __table_args__ = (
+        Index("ix_reviews_room_created", "room_id", "created_at", "id"),
+        Index("ix_reviews_room_rating", "room_id", "rating"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -189,5 +207,7 @@ class Review(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
-    user = relationship("User", back_populates="reviews")
-    room = relationship("Room", back_populates="reviews")
+    # Nothing reads these per review; "raise" makes an accidental N+1 in a
+    # listing fail loudly instead of issuing one SELECT per row.
+    user = relationship("User", back_populates="reviews", lazy="raise")
+    room = relationship("Room", back_populates="reviews", lazy="raise")
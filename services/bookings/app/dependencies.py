@@ -8,11 +8,11 @@ This module wires:
 * Simple role-based access helpers.
 """
 
+from dataclasses import dataclass
 from typing import Callable, List
 
 from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from common.auth import verify_access_token
@@ -31,7 +31,8 @@ from db.init_db import get_db as _get_db
 security_scheme = HTTPBearer()
 
 
-class CurrentUser(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CurrentUser:
     """
     Lightweight representation of the authenticated user used by the Bookings service.
     """
@@ -6,9 +6,9 @@ This module encapsulates all direct database interactions involving the
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
-from sqlalchemy import and_, or_, func, case
+from sqlalchemy import and_, or_, func, case, exists, select, text
 from sqlalchemy.orm import Session
 
 from db.schema import Booking
@@ -74,6 +74,35 @@ def list_user_bookings(db: Session, user_id: int, *, offset: int = 0, limit: Opt
     return query.all()
 
 
+def user_has_booking_for_room(db: Session, *, user_id: int, room_id: int) -> bool:
+    """
+    Return ``True`` if the user has any booking, in any status, for the room.
+    """
+    return bool(
+        db.execute(
+            select(exists().where(Booking.user_id == user_id, Booking.room_id == room_id))
+        ).scalar()
+    )
+
+
+def lock_room_for_booking(db: Session, room_id: int) -> None:
+    """
+    Serialize booking writes for a room until the current transaction ends.
+
+    On PostgreSQL this takes a transaction-scoped advisory lock keyed by the
+    room id, so concurrent create/update attempts for the same room run
+    their conflict check one at a time without row-locking ``rooms`` (reads
+    of the room and analytics queries are unaffected). The lock is released
+    automatically on commit or rollback. Other dialects are left untouched.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    db.execute(
+        text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+        {"key": f"booking:room:{room_id}"},
+    )
+
+
 def find_conflicting_bookings(
     db: Session,
     *,
@@ -101,6 +130,59 @@ def find_conflicting_bookings(
     return db.query(Booking).filter(*conditions).all()
 
 
+def has_conflict(
+    db: Session,
+    *,
+    room_id: int,
+    start_time: datetime,
+    end_time: datetime,
+    exclude_booking_id: Optional[int] = None,
+) -> bool:
+    """
+    Return ``True`` if any non-cancelled booking overlaps the given range.
+
+    Unlike :func:`find_conflicting_bookings` this issues a single
+    ``SELECT EXISTS(...)`` so the database can stop at the first match
+    without materializing any rows.
+    """
+    conditions = [
+        Booking.room_id == room_id,
+        Booking.status != "cancelled",
+        Booking.start_time < end_time,
+        Booking.end_time > start_time,
+    ]
+    if exclude_booking_id is not None:
+        conditions.append(Booking.id != exclude_booking_id)
+
+    return bool(db.execute(select(exists().where(*conditions))).scalar())
+
+
+def booked_room_ids(
+    db: Session,
+    *,
+    room_ids: Iterable[int],
+    start_time: datetime,
+    end_time: datetime,
+) -> Set[int]:
+    """
+    Return the subset of ``room_ids`` with a non-cancelled booking overlapping the range.
+
+    One ``SELECT DISTINCT room_id`` answers :func:`has_conflict` for every
+    room at once.
+    """
+    stmt = (
+        select(Booking.room_id)
+        .where(
+            Booking.room_id.in_(list(room_ids)),
+            Booking.status != "cancelled",
+            Booking.start_time < end_time,
+            Booking.end_time > start_time,
+        )
+        .distinct()
+    )
+    return set(db.scalars(stmt))
+
+
 def save_booking(db: Session, booking: Booking) -> Booking:
     """
     Persist changes to an existing booking and refresh it.
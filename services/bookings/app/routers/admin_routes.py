@@ -153,3 +153,24 @@ def list_bookings_for_user_and_room(
         room_id=room_id,
     )
     return bookings
+
+
+@router.get(
+    "/user/{user_id}/room/{room_id}/exists",
+    response_model=schemas.BookingExistsResponse,
+    status_code=status.HTTP_200_OK,
+)
+def user_has_booking_for_room(
+    user_id: int,
+    room_id: int,
+    db: Session = Depends(get_db),
+    _: CurrentUser = Depends(require_roles(ADMIN_FM_AUDITOR_SERVICE)),
+):
+    """
+    Report whether a user has any booking for a room.
+
+    A yes/no answer for callers such as the Reviews service that would
+    otherwise fetch the full booking list just to check it is non-empty.
+    """
+    exists = booking_service.user_has_booking_for_room(db, user_id=user_id, room_id=room_id)
+    return {"exists": exists}
@@ -11,7 +11,7 @@ These routes allow authenticated users to:
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from db.init_db import get_db
@@ -169,3 +169,38 @@ def check_availability(
             detail=str(exc),
         )
     return {"room_id": room_id, "available": available}
+
+
+@router.get(
+    "/check-availability/batch",
+    status_code=status.HTTP_200_OK,
+)
+def check_availability_batch(
+    start_time: datetime,
+    end_time: datetime,
+    room_ids: List[int] = Query(..., min_length=1, max_length=500),
+    db: Session = Depends(get_db),
+    _: CurrentUser = Depends(get_current_user),
+) -> List[dict]:
+    """
+    Availability of several rooms over one window, answered with one query.
+
+    Returns one ``{"room_id", "available"}`` item per requested room, in
+    request order.
+    """
+    try:
+        availability = booking_service.room_availability(
+            db,
+            room_ids=room_ids,
+            start_time=start_time,
+            end_time=end_time,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    return [
+        {"room_id": room_id, "available": available}
+        for room_id, available in availability.items()
+    ]
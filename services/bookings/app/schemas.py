@@ -8,7 +8,7 @@ decoupling external representations from internal database models.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BookingBase(BaseModel):
@@ -71,12 +71,10 @@ class BookingRead(BaseModel):
     end_time: datetime = Field(..., description="End time of the booking.")
     status: str = Field(..., description="Current status of the booking.")
 
-    class Config:
-        """
-        Enable ORM mode so SQLAlchemy models can be returned directly.
-        """
-
-        from_attributes = True
+    # Enable ORM mode so SQLAlchemy models can be returned directly. Pydantic
+    # v2 builds the validator eagerly at class creation (``defer_build`` is
+    # off), so the first request does not pay the schema compile cost.
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
 
 
 class BookingsSummaryResponse(BaseModel):
@@ -85,6 +83,10 @@ class BookingsSummaryResponse(BaseModel):
     cancelled_bookings: int
 
 
+class BookingExistsResponse(BaseModel):
+    exists: bool
+
+
 class BookingsByRoomItem(BaseModel):
     room_id: int
     total: int
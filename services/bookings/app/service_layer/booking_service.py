@@ -11,7 +11,7 @@ The logic here is independent from FastAPI and can be tested in isolation.
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Dict, List
 
 from sqlalchemy.orm import Session
 
@@ -21,6 +21,7 @@ from services.bookings.app.clients import users_client, rooms_client
 from common.exceptions import BadRequestError, ConflictError, ForbiddenError, NotFoundError
 from common.notifications import send_booking_created_notification, send_booking_cancelled_notification
 from common.logging_utils import get_logger
+from common.ttl_cache import TTLCache
 
 _logger = get_logger(__name__)
 
@@ -28,6 +29,20 @@ _logger = get_logger(__name__)
 MIN_DURATION = timedelta(minutes=5)
 MAX_DURATION = timedelta(hours=24)
 
+# Short-lived in-process cache for the admin summary endpoint. Writes that
+# change booking counts clear it so the TTL only bounds staleness across
+# worker processes. Readers pass the cache generation back on store, so a
+# summary computed before an invalidation is not kept after it.
+SUMMARY_CACHE_TTL_SECONDS = 5.0
+_summary_cache: TTLCache[str, dict] = TTLCache(SUMMARY_CACHE_TTL_SECONDS, maxsize=1)
+
+
+def _invalidate_summary_cache() -> None:
+    """
+    Drop any cached booking summary so the next read hits the database.
+    """
+    _summary_cache.clear()
+
 
 class BookingConflictError(ConflictError):
     """
@@ -125,6 +140,7 @@ def create_booking(
         # Tests expect ValueError for missing user/room
         raise ValueError(str(exc))
 
+    booking_repository.lock_room_for_booking(db, room_id)
     conflicts = booking_repository.find_conflicting_bookings(
         db,
         room_id=room_id,
@@ -137,45 +153,12 @@ def create_booking(
 
     if conflicts and force_override:
         # Administrative override: mark conflicting bookings as cancelled.
+        # Flush rather than commit so the room lock is held until the new
+        # booking is committed together with the cancellations.
         for c in conflicts:
             c.status = "cancelled"
             db.add(c)
-        db.commit()
-        
-        # Send cancellation notifications for force-cancelled bookings
-        for cancelled_booking in conflicts:
-            try:
-                user_data = users_client.get_user(cancelled_booking.user_id)
-                room_data = rooms_client.get_room(cancelled_booking.room_id)
-                
-                if user_data and room_data:
-                    user_email = user_data.get("email")
-                    room_name = room_data.get("name")
-                    
-                    if user_email and room_name:
-                        send_booking_cancelled_notification(
-                            user_email=user_email,
-                            room_name=room_name,
-                            start_time=cancelled_booking.start_time,
-                            end_time=cancelled_booking.end_time,
-                        )
-                    else:
-                        _logger.warning(
-                            "Cannot send force-cancellation notification: missing email or room name for booking %s",
-                            cancelled_booking.id,
-                        )
-                else:
-                    _logger.warning(
-                        "Cannot send force-cancellation notification: failed to fetch user or room data for booking %s",
-                        cancelled_booking.id,
-                    )
-            except Exception as exc:
-                # Log but don't raise - notification failure should not break booking flow
-                _logger.exception(
-                    "Failed to send force-cancellation notification for booking %s: %s",
-                    cancelled_booking.id,
-                    exc,
-                )
+        db.flush()
 
     booking = booking_repository.create_booking(
         db,
@@ -185,7 +168,44 @@ def create_booking(
         end_time=end_time,
         status="confirmed",
     )
+    _invalidate_summary_cache()
     
+    # Notify owners of force-cancelled bookings only once the cancellations
+    # have committed with the new booking (and the room lock is released).
+    for cancelled_booking in conflicts:
+        try:
+            user_data = users_client.get_user(cancelled_booking.user_id)
+            room_data = rooms_client.get_room(cancelled_booking.room_id)
+            
+            if user_data and room_data:
+                user_email = user_data.get("email")
+                room_name = room_data.get("name")
+                
+                if user_email and room_name:
+                    send_booking_cancelled_notification(
+                        user_email=user_email,
+                        room_name=room_name,
+                        start_time=cancelled_booking.start_time,
+                        end_time=cancelled_booking.end_time,
+                    )
+                else:
+                    _logger.warning(
+                        "Cannot send force-cancellation notification: missing email or room name for booking %s",
+                        cancelled_booking.id,
+                    )
+            else:
+                _logger.warning(
+                    "Cannot send force-cancellation notification: failed to fetch user or room data for booking %s",
+                    cancelled_booking.id,
+                )
+        except Exception as exc:
+            # Log but don't raise - notification failure should not break booking flow
+            _logger.exception(
+                "Failed to send force-cancellation notification for booking %s: %s",
+                cancelled_booking.id,
+                exc,
+            )
+
     # Send notification after booking is successfully created
     try:
         user_data = users_client.get_user(user_id)
@@ -250,11 +270,28 @@ def list_bookings_for_user_room(db: Session, *, user_id: int, room_id: int) -> L
     ]
 
 
+def user_has_booking_for_room(db: Session, *, user_id: int, room_id: int) -> bool:
+    """
+    Return whether the user has (or had) a booking for the room.
+    """
+    return booking_repository.user_has_booking_for_room(db, user_id=user_id, room_id=room_id)
+
+
 def get_bookings_summary(db: Session) -> dict:
     """
     Return aggregated booking counts.
+
+    Results are served from a small in-process cache for
+    :data:`SUMMARY_CACHE_TTL_SECONDS`; booking writes invalidate it.
     """
-    return booking_repository.get_bookings_summary(db)
+    cached = _summary_cache.get("summary")
+    if cached is not None:
+        return dict(cached)
+    generation = _summary_cache.generation
+
+    summary = booking_repository.get_bookings_summary(db)
+    _summary_cache.set("summary", summary, generation=generation)
+    return dict(summary)
 
 
 def get_bookings_by_room(db: Session) -> List[dict]:
@@ -275,14 +312,32 @@ def is_room_available(
     Return True if no confirmed bookings overlap the given window.
     """
     start_time, end_time = _normalize_and_validate_time_range(start_time, end_time)
-    conflicts = booking_repository.find_conflicting_bookings(
+    return not booking_repository.has_conflict(
         db,
         room_id=room_id,
         start_time=start_time,
         end_time=end_time,
-        exclude_booking_id=None,
     )
-    return len(conflicts) == 0
+
+
+def room_availability(
+    db: Session,
+    *,
+    room_ids: List[int],
+    start_time: datetime,
+    end_time: datetime,
+) -> Dict[int, bool]:
+    """
+    Batch form of :func:`is_room_available`: map each room id to its availability.
+    """
+    start_time, end_time = _normalize_and_validate_time_range(start_time, end_time)
+    booked = booking_repository.booked_room_ids(
+        db,
+        room_ids=room_ids,
+        start_time=start_time,
+        end_time=end_time,
+    )
+    return {room_id: room_id not in booked for room_id in room_ids}
 
 
 def update_booking_time(
@@ -328,6 +383,7 @@ def update_booking_time(
     if not (is_owner or is_admin_like):
         raise BookingPermissionError("You are not allowed to modify this booking.")
 
+    booking_repository.lock_room_for_booking(db, booking.room_id)
     conflicts = booking_repository.find_conflicting_bookings(
         db,
         room_id=booking.room_id,
@@ -389,6 +445,7 @@ def cancel_booking(
     if booking.status != "cancelled":
         booking.status = "cancelled"
         cancelled_booking = booking_repository.save_booking(db, booking)
+        _invalidate_summary_cache()
         
         # Send notification after booking is successfully cancelled
         try:
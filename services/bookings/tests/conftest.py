@@ -0,0 +1,192 @@
+"""
+Pytest fixtures for the Bookings service.
+
+This module provides:
+
+* An in-memory SQLite engine for the service-layer tests.
+* A session-scoped fixture that creates the schema and seeds users and rooms once.
+* A per-test ``db`` session whose writes are rolled back afterwards (see
+  :mod:`tests.sqlite_savepoint`).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Generator, List, Optional
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from db.schema import Base, Booking, Room, User
+from services.bookings.app.service_layer import booking_service
+from tests.sqlite_savepoint import create_savepoint_engine, savepoint_session
+
+engine = create_savepoint_engine()
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_throwaway_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Skip durability bookkeeping; the test database is discarded anyway.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+# Payloads served by the stubbed Users/Rooms clients, filled in by ``seed_ids``.
+_USER_PAYLOADS: Dict[int, dict] = {}
+_ROOM_PAYLOADS: Dict[int, dict] = {}
+
+
+@pytest.fixture(scope="session")
+def seed_ids() -> Generator[Dict[str, int], None, None]:
+    """
+    Create the schema, seed the shared users and rooms, and yield their ids.
+
+    Keys are ``alice_id``, ``bob_id``, ``admin_id``, ``room_a_id`` and
+    ``room_z_id`` so tests can fetch rows with ``Session.get``.
+    """
+    Base.metadata.create_all(bind=engine)
+    # The database is fresh, so the fixed rows go in as one batched INSERT per
+    # table with no existence checks.
+    with TestingSessionLocal() as db:
+        users = db.execute(
+            insert(User).returning(User.id, User.name, User.username, User.email),
+            [
+                {
+                    "name": username.title(),
+                    "username": username,
+                    "email": f"{username}@example.com",
+                    "password_hash": "hashed",
+                    "role": role,
+                }
+                for username, role in (
+                    ("alice", "regular"),
+                    ("bob", "regular"),
+                    ("admin", "admin"),
+                )
+            ],
+        )
+        rooms = db.execute(
+            insert(Room).returning(Room.id, Room.name, Room.location, Room.capacity),
+            [
+                {
+                    "name": room_name,
+                    "capacity": 10,
+                    "equipment": "[]",
+                    "location": "Building A",
+                    "status": "active",
+                }
+                for room_name in ("Room A", "Room Z")
+            ],
+        )
+        ids: Dict[str, int] = {}
+        for row in users:
+            ids[f"{row.username}_id"] = row.id
+            _USER_PAYLOADS[row.id] = row._asdict()
+        for row in rooms:
+            ids[f"{row.name.lower().replace(' ', '_')}_id"] = row.id
+            _ROOM_PAYLOADS[row.id] = row._asdict()
+        db.commit()
+    yield ids
+
+
+@pytest.fixture(autouse=True)
+def stub_service_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Answer the service layer's Users/Rooms lookups from the seeded payloads.
+
+    ``create_booking`` and ``cancel_booking`` fetch user and room data for
+    notifications; without this every call goes through the real HTTP
+    clients and their retries. Unknown ids get ``None``, like a 404.
+    """
+    monkeypatch.setattr(booking_service.users_client, "get_user", _USER_PAYLOADS.get)
+    monkeypatch.setattr(booking_service.rooms_client, "get_room", _ROOM_PAYLOADS.get)
+
+
+@pytest.fixture
+def db(seed_ids: Dict[str, int]) -> Generator[Session, None, None]:
+    """
+    Provide a session joined to an outer transaction that is rolled back.
+    """
+    try:
+        with savepoint_session(engine, TestingSessionLocal) as session:
+            yield session
+    finally:
+        # The rolled-back rows never went through the service, so drop any
+        # summary it cached while the test ran.
+        booking_service._invalidate_summary_cache()
+
+
+@pytest.fixture(scope="session")
+def now() -> datetime:
+    """
+    Reference time shared by the whole run; tests offset bookings from it.
+    """
+    return datetime.now()
+
+
+@pytest.fixture
+def booking_factory(
+    db: Session, seed_ids: Dict[str, int], now: datetime
+) -> Callable[..., Booking]:
+    """
+    Return ``make(...)``, which books a room through the service layer.
+
+    Defaults to alice booking Room A for one hour, ``days`` after :func:`now`. Pass
+    ``start`` to pin the exact start time instead.
+    """
+
+    def make(
+        *,
+        user: Optional[User] = None,
+        room: Optional[Room] = None,
+        days: int = 10,
+        hours: int = 1,
+        start: Optional[datetime] = None,
+        override: bool = False,
+    ) -> Booking:
+        user = user or db.get(User, seed_ids["alice_id"])
+        room = room or db.get(Room, seed_ids["room_a_id"])
+        start = start or now + timedelta(days=days)
+        return booking_service.create_booking(
+            db,
+            user_id=user.id,
+            role=user.role,
+            room_id=room.id,
+            start_time=start,
+            end_time=start + timedelta(hours=hours),
+            force_override=override,
+        )
+
+    return make
+
+
+@pytest.fixture
+def seed_bookings(db: Session) -> Callable[[List[dict]], List[Booking]]:
+    """
+    Return a helper that inserts booking rows in one statement.
+
+    Meant for tests that exercise update or cancel paths and only need the
+    bookings to exist; it skips the conflict checks and notifications of
+    ``create_booking``. Rows default to ``status="confirmed"``.
+    """
+
+    def insert_rows(rows: List[dict]) -> List[Booking]:
+        bookings = db.scalars(
+            insert(Booking).returning(Booking, sort_by_parameter_order=True),
+            [{"status": "confirmed", **row} for row in rows],
+        ).all()
+        db.commit()
+        return list(bookings)
+
+    return insert_rows
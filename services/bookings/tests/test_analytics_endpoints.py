@@ -60,19 +60,16 @@ def setup_module(module):
         room1 = Room(name="R1", capacity=5, equipment="", location="HQ", status="active")
         room2 = Room(name="R2", capacity=5, equipment="", location="HQ", status="active")
         db.add_all([admin, user, room1, room2])
-        db.commit()
-        db.refresh(admin)
-        db.refresh(user)
-        db.refresh(room1)
-        db.refresh(room2)
+        # Flush assigns primary keys without a commit + refresh round trip.
+        db.flush()
 
         now = datetime.utcnow()
-        bookings = [
-            Booking(user_id=user.id, room_id=room1.id, start_time=now, end_time=now + timedelta(hours=1), status="confirmed"),
-            Booking(user_id=user.id, room_id=room1.id, start_time=now + timedelta(days=1), end_time=now + timedelta(days=1, hours=1), status="cancelled"),
-            Booking(user_id=user.id, room_id=room2.id, start_time=now + timedelta(days=2), end_time=now + timedelta(days=2, hours=1), status="confirmed"),
+        rows = [
+            {"user_id": user.id, "room_id": room1.id, "start_time": now, "end_time": now + timedelta(hours=1), "status": "confirmed"},
+            {"user_id": user.id, "room_id": room1.id, "start_time": now + timedelta(days=1), "end_time": now + timedelta(days=1, hours=1), "status": "cancelled"},
+            {"user_id": user.id, "room_id": room2.id, "start_time": now + timedelta(days=2), "end_time": now + timedelta(days=2, hours=1), "status": "confirmed"},
         ]
-        db.add_all(bookings)
+        db.bulk_insert_mappings(Booking, rows)
         db.commit()
 
 
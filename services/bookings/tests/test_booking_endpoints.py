@@ -3,10 +3,15 @@ Integration tests for the Bookings service HTTP API.
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Generator
 
+import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import bindparam, create_engine, event, insert, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 import sys
 from pathlib import Path
@@ -16,108 +21,192 @@ ROOT_DIR = Path(__file__).resolve().parents[3]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from common.auth import get_password_hash, create_access_token
+from common.auth import create_access_token
 from db.schema import Base, Booking, User, Room
 from db.init_db import get_db
 from services.bookings.app.main import app
 from unittest.mock import patch
 
+# These tests mint JWTs directly and never go through /login, so the stored
+# hash is never verified. Skip bcrypt entirely and store fixed sentinels.
+_REGULAR_PWHASH = "$test$password123"
+_ADMIN_PWHASH = "$test$adminpass"
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_bookings_api.db"
+# Fixed, far-future booking windows keyed by day offset. Each test uses its
+# own offset so windows never collide, and no test depends on the clock.
+BASE = datetime(2099, 1, 1)
+SLOTS = {
+    days: BASE + timedelta(days=days)
+    for days in (30, 31, 32, 40, 44, 45, 46, 50)
+}
+
+# Pure in-memory database. StaticPool hands every session the same single
+# connection, so the schema created below stays visible to all of them.
+SQLALCHEMY_DATABASE_URL = "sqlite://"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
     future=True,
+    query_cache_size=1200,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-def override_get_db():
+# pysqlite manages BEGIN itself and mishandles SAVEPOINT; hand transaction
+# control to SQLAlchemy so the per-test savepoints below behave.
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record) -> None:
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+Base.metadata.create_all(bind=engine)
+
+# Seed users and rooms with one batched Core INSERT per table; the rows are
+# fixed data, so there is nothing for the ORM unit of work to track.
+_SEED_USERS = [
+    {
+        "name": "regular_user",
+        "username": "regular_user",
+        "email": "regular@example.com",
+        "password_hash": _REGULAR_PWHASH,
+        "role": "regular",
+    },
+    {
+        "name": "admin_user",
+        "username": "admin_user",
+        "email": "admin@example.com",
+        "password_hash": _ADMIN_PWHASH,
+        "role": "admin",
+    },
+]
+_SEED_ROOMS = [
+    {
+        "name": "Room E",
+        "capacity": 8,
+        "equipment": "[]",
+        "location": "Building B",
+        "status": "active",
+    },
+]
+
+with TestingSessionLocal() as db:
+    # Existence checks fetch only the key column of the seeded rows.
+    existing_users = set(
+        db.execute(
+            select(User.username).where(
+                User.username.in_([row["username"] for row in _SEED_USERS])
+            )
+        ).scalars()
+    )
+    new_users = [row for row in _SEED_USERS if row["username"] not in existing_users]
+    if new_users:
+        db.execute(insert(User), new_users)
+
+    existing_rooms = set(
+        db.execute(
+            select(Room.name).where(Room.name.in_([row["name"] for row in _SEED_ROOMS]))
+        ).scalars()
+    )
+    new_rooms = [row for row in _SEED_ROOMS if row["name"] not in existing_rooms]
+    if new_rooms:
+        db.execute(insert(Room), new_rooms)
+
+    db.commit()
+
+    # Resolve the fixture ids once; tests reuse them instead of re-querying.
+    ROOM_E_ID = db.scalar(select(Room.id).filter_by(name="Room E"))
+    REGULAR_USER_ID = db.scalar(select(User.id).filter_by(username="regular_user"))
+    ADMIN_USER_ID = db.scalar(select(User.id).filter_by(username="admin_user"))
+
+
+@pytest.fixture(scope="module")
+def client() -> Generator[TestClient, None, None]:
+    """
+    Provide one FastAPI test client for the whole module.
+
+    The context-manager form starts the app's portal once and shuts it down
+    cleanly after the last test instead of leaving it to garbage collection.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def db_connection() -> Generator[Connection, None, None]:
     """
-    Override dependency to use a dedicated SQLite test database.
+    Hold one connection inside an outer transaction that is never committed.
     """
-    db = TestingSessionLocal()
+    connection = engine.connect()
+    transaction = connection.begin()
     try:
-        yield db
+        yield connection
     finally:
-        db.close()
+        transaction.rollback()
+        connection.close()
 
 
-# Apply DB override and create tables
-app.dependency_overrides[get_db] = override_get_db
-Base.metadata.create_all(bind=engine)
+@pytest.fixture(scope="module")
+def db_session(db_connection: Connection) -> Generator[Session, None, None]:
+    """
+    Provide one session shared by the tests and the API under test.
 
-# Seed users and rooms
-with TestingSessionLocal() as db:
-    if not db.query(User).filter_by(username="regular_user").first():
-        regular = User(
-            name="regular_user",
-            username="regular_user",
-            email="regular@example.com",
-            password_hash=get_password_hash("password123"),
-            role="regular",
-        )
-        db.add(regular)
-
-    if not db.query(User).filter_by(username="admin_user").first():
-        admin = User(
-            name="admin_user",
-            username="admin_user",
-            email="admin@example.com",
-            password_hash=get_password_hash("adminpass"),
-            role="admin",
-        )
-        db.add(admin)
-
-    if not db.query(Room).filter_by(name="Room E").first():
-        room = Room(
-            name="Room E",
-            capacity=8,
-            equipment="[]",
-            location="Building B",
-            status="active",
-        )
-        db.add(room)
+    ``commit()`` calls made by the service layer only release a savepoint, so
+    nothing escapes the outer transaction held by :func:`db_connection`.
+    """
+    db = TestingSessionLocal(bind=db_connection, join_transaction_mode="create_savepoint")
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        yield db
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        db.close()
 
-    db.commit()
 
-client = TestClient(app)
+@pytest.fixture(autouse=True)
+def _rollback_test_writes(
+    db_connection: Connection, db_session: Session
+) -> Generator[None, None, None]:
+    """
+    Wrap each test in a savepoint and roll it back afterwards.
+
+    Rows the test committed vanish with the savepoint, so their identities are
+    expunged too; ids get reused by the next test's inserts.
+    """
+    savepoint = db_connection.begin_nested()
+    yield
+    db_session.rollback()
+    savepoint.rollback()
+    db_session.expunge_all()
 
 
+@lru_cache(maxsize=None)
 def _get_token(username: str, role: str, user_id: int) -> str:
     """
     Helper to build JWTs for tests.
 
     Note: we skip the real login flow and go directly through the token
-    creation helper for simplicity.
+    creation helper for simplicity. Tokens are memoized per principal so
+    each one is only signed once per test run.
     """
     return create_access_token(subject=str(user_id), role=role)
 
 
-def test_create_booking_endpoint() -> None:
+def test_create_booking_endpoint(client: TestClient, db_session: Session) -> None:
     """
     Regular user should be able to create a non-conflicting booking.
     """
-    with TestingSessionLocal() as db:
-        # Clear any existing bookings for this room to avoid conflicts
-        room_e = db.query(Room).filter_by(name="Room E").first()
-        if room_e:
-            db.query(Booking).filter_by(room_id=room_e.id).delete()
-        db.commit()
-        
-        user = db.query(User).filter_by(username="regular_user").first()
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert user is not None
-        assert room is not None
-        token = _get_token(user.username, user.role, user.id)
-        
-        # Extract IDs before session closes
-        user_id = user.id
-        room_id = room.id
+    token = _get_token("regular_user", "regular", REGULAR_USER_ID)
+    user_id = REGULAR_USER_ID
+    room_id = ROOM_E_ID
 
-    # Use a future date to avoid conflicts
-    start = (datetime.now() + timedelta(days=30)).replace(microsecond=0)
+    start = SLOTS[30]
     end = start + timedelta(hours=1)
 
     response = client.post(
@@ -136,43 +225,29 @@ def test_create_booking_endpoint() -> None:
     assert data["status"] == "confirmed"
 
 
-def test_conflicting_booking_returns_409() -> None:
+def test_conflicting_booking_returns_409(client: TestClient, db_session: Session) -> None:
     """
     Creating a conflicting booking as a regular user should return HTTP 409.
     """
-    with TestingSessionLocal() as db:
-        # Clear any existing bookings for this room to avoid conflicts
-        room_e = db.query(Room).filter_by(name="Room E").first()
-        if room_e:
-            db.query(Booking).filter_by(room_id=room_e.id).delete()
-        db.commit()
-        
-        user = db.query(User).filter_by(username="regular_user").first()
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert user is not None
-        assert room is not None
-        token = _get_token(user.username, user.role, user.id)
-        
-        # Extract IDs before session closes
-        user_id = user.id
-        room_id = room.id
+    token = _get_token("regular_user", "regular", REGULAR_USER_ID)
+    user_id = REGULAR_USER_ID
+    room_id = ROOM_E_ID
 
-        # Use a future date to avoid conflicts
-        start = (datetime.now() + timedelta(days=31)).replace(microsecond=0)
-        end = start + timedelta(hours=1)
+    start = SLOTS[31]
+    end = start + timedelta(hours=1)
 
-        # First booking (base)
-        from services.bookings.app.service_layer import booking_service
-
-        booking_service.create_booking(
-            db,
-            user_id=user_id,
-            role=user.role,
-            room_id=room_id,
-            start_time=start,
-            end_time=end,
-            force_override=False,
-        )
+    # First booking (base)
+    from services.bookings.app.service_layer import booking_service
+
+    booking_service.create_booking(
+        db_session,
+        user_id=user_id,
+        role="regular",
+        room_id=room_id,
+        start_time=start,
+        end_time=end,
+        force_override=False,
+    )
 
     # Second overlapping booking via API
     response = client.post(
@@ -187,46 +262,31 @@ def test_conflicting_booking_returns_409() -> None:
     assert response.status_code == 409, response.text
 
 
-def test_admin_override_endpoint() -> None:
+def test_admin_override_endpoint(client: TestClient, db_session: Session) -> None:
     """
     Admin should be able to create a booking with override while cancelling
     conflicting bookings.
     """
-    with TestingSessionLocal() as db:
-        # Clear any existing bookings for this room to avoid conflicts
-        room_e = db.query(Room).filter_by(name="Room E").first()
-        if room_e:
-            db.query(Booking).filter_by(room_id=room_e.id).delete()
-        db.commit()
-        
-        admin = db.query(User).filter_by(username="admin_user").first()
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert admin is not None
-        assert room is not None
-        admin_token = _get_token(admin.username, admin.role, admin.id)
-        
-        # Extract IDs before session closes
-        admin_id = admin.id
-        room_id = room.id
+    admin_token = _get_token("admin_user", "admin", ADMIN_USER_ID)
+    admin_id = ADMIN_USER_ID
+    room_id = ROOM_E_ID
 
-        # Use a future date to avoid conflicts
-        start = (datetime.now() + timedelta(days=32)).replace(microsecond=0)
-        end = start + timedelta(hours=1)
+    start = SLOTS[32]
+    end = start + timedelta(hours=1)
 
-        from services.bookings.app.service_layer import booking_service
+    from services.bookings.app.service_layer import booking_service
 
-        existing = booking_service.create_booking(
-            db,
-            user_id=admin_id,
-            role=admin.role,
-            room_id=room_id,
-            start_time=start,
-            end_time=end,
-            force_override=False,
-        )
-        db.refresh(existing)
-        assert existing.status == "confirmed"
-        existing_id = existing.id
+    existing = booking_service.create_booking(
+        db_session,
+        user_id=admin_id,
+        role="admin",
+        room_id=room_id,
+        start_time=start,
+        end_time=end,
+        force_override=False,
+    )
+    assert existing.status == "confirmed"
+    existing_id = existing.id
 
     response = client.post(
         "/api/v1/admin/bookings/override",
@@ -241,62 +301,69 @@ def test_admin_override_endpoint() -> None:
     new_booking = response.json()
     assert new_booking["status"] == "confirmed"
 
-    # Verify the original booking is now cancelled
-    with TestingSessionLocal() as db:
-        refreshed = db.query(Booking).get(existing_id)
-        assert refreshed is not None
-        assert refreshed.status == "cancelled"
-
-
-def _ensure_user(username: str, role: str = "regular") -> User:
-    with TestingSessionLocal() as db:
-        user = db.query(User).filter_by(username=username).first()
-        if user is None:
-            user = User(
-                name=username,
-                username=username,
-                email=f"{username}@example.com",
-                password_hash=get_password_hash("password123"),
-                role=role,
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-        return user
+    # Verify the original booking is now cancelled; the API committed through
+    # its own session, so drop our cached copy first.
+    db_session.expire_all()
+    refreshed = db_session.get(Booking, existing_id)
+    assert refreshed is not None
+    assert refreshed.status == "cancelled"
 
 
-def _clear_all_bookings() -> None:
-    with TestingSessionLocal() as db:
-        db.query(Booking).delete()
-        db.commit()
+# Built once so every lookup hits the same compiled-statement cache entry.
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("u"))
 
 
-def test_list_my_bookings_returns_created_entries() -> None:
+def _ensure_user(db_session: Session, username: str, role: str = "regular") -> User:
+    user = db_session.execute(_USER_BY_USERNAME, {"u": username}).scalar_one_or_none()
+    if user is None:
+        user = User(
+            name=username,
+            username=username,
+            email=f"{username}@example.com",
+            password_hash=_REGULAR_PWHASH,
+            role=role,
+        )
+        db_session.add(user)
+        db_session.commit()
+        db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def booking_owner(db_session: Session) -> User:
     """
-    ``GET /bookings/me`` should list bookings created by the caller.
+    Regular user who owns the booking made by :func:`created_booking`.
     """
-    _clear_all_bookings()
-    user = _ensure_user("list_user")
+    return _ensure_user(db_session, "booking_owner")
 
-    with TestingSessionLocal() as db:
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert room is not None
-        room_id = room.id
-    token = _get_token(username=user.username, role=user.role, user_id=user.id)
 
-    start = (datetime.now() + timedelta(days=40)).replace(microsecond=0)
-    end = start + timedelta(hours=2)
+@pytest.fixture
+def created_booking(client: TestClient, booking_owner: User) -> int:
+    """
+    Create a one-hour booking in Room E through the API and return its id.
+    """
+    token = _get_token(booking_owner.username, booking_owner.role, booking_owner.id)
+    start = SLOTS[40]
     resp = client.post(
         "/api/v1/bookings/",
         json={
-            "room_id": room_id,
+            "room_id": ROOM_E_ID,
             "start_time": start.isoformat(),
-            "end_time": end.isoformat(),
+            "end_time": (start + timedelta(hours=1)).isoformat(),
         },
         headers={"Authorization": f"Bearer {token}"},
     )
     assert resp.status_code == 201, resp.text
-    created_id = resp.json()["id"]
+    return resp.json()["id"]
+
+
+def test_list_my_bookings_returns_created_entries(
+    client: TestClient, booking_owner: User, created_booking: int
+) -> None:
+    """
+    ``GET /bookings/me`` should list bookings created by the caller.
+    """
+    token = _get_token(booking_owner.username, booking_owner.role, booking_owner.id)
 
     list_resp = client.get(
         "/api/v1/bookings/me",
@@ -304,40 +371,21 @@ def test_list_my_bookings_returns_created_entries() -> None:
     )
     assert list_resp.status_code == 200
     payload = list_resp.json()
-    assert any(item["id"] == created_id for item in payload)
+    assert any(item["id"] == created_booking for item in payload)
 
 
-def test_update_booking_endpoint_allows_owner() -> None:
+def test_update_booking_endpoint_allows_owner(
+    client: TestClient, booking_owner: User, created_booking: int
+) -> None:
     """
     Owners should be able to update their booking time window.
     """
-    _clear_all_bookings()
-    user = _ensure_user("update_user")
-
-    with TestingSessionLocal() as db:
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert room is not None
-        room_id = room.id
-    token = _get_token(username=user.username, role=user.role, user_id=user.id)
+    token = _get_token(booking_owner.username, booking_owner.role, booking_owner.id)
 
-    start = (datetime.now() + timedelta(days=41)).replace(microsecond=0)
-    end = start + timedelta(hours=2)
-    resp = client.post(
-        "/api/v1/bookings/",
-        json={
-            "room_id": room_id,
-            "start_time": start.isoformat(),
-            "end_time": end.isoformat(),
-        },
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    assert resp.status_code == 201
-    booking_id = resp.json()["id"]
-
-    new_start = start + timedelta(hours=3)
+    new_start = SLOTS[40] + timedelta(hours=3)
     new_end = new_start + timedelta(hours=1)
     update_resp = client.put(
-        f"/api/v1/bookings/{booking_id}",
+        f"/api/v1/bookings/{created_booking}",
         json={
             "start_time": new_start.isoformat(),
             "end_time": new_end.isoformat(),
@@ -350,92 +398,79 @@ def test_update_booking_endpoint_allows_owner() -> None:
     assert body["end_time"].startswith(new_end.isoformat())
 
 
-def test_update_booking_endpoint_rejects_other_users() -> None:
+def test_update_booking_endpoint_rejects_other_users(
+    client: TestClient, db_session: Session, created_booking: int
+) -> None:
     """
     A user must not update someone else's booking.
     """
-    _clear_all_bookings()
-    owner = _ensure_user("owner_user")
-    intruder = _ensure_user("intruder_user")
-
-    with TestingSessionLocal() as db:
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert room is not None
-        room_id = room.id
-    owner_token = _get_token(owner.username, owner.role, owner.id)
+    intruder = _ensure_user(db_session, "intruder_user")
     intruder_token = _get_token(intruder.username, intruder.role, intruder.id)
 
-    start = (datetime.now() + timedelta(days=42)).replace(microsecond=0)
-    end = start + timedelta(hours=1)
-    resp = client.post(
-        "/api/v1/bookings/",
-        json={
-            "room_id": room_id,
-            "start_time": start.isoformat(),
-            "end_time": end.isoformat(),
-        },
-        headers={"Authorization": f"Bearer {owner_token}"},
-    )
-    booking_id = resp.json()["id"]
-
+    start = SLOTS[40]
     update_resp = client.put(
-        f"/api/v1/bookings/{booking_id}",
+        f"/api/v1/bookings/{created_booking}",
         json={
             "start_time": (start + timedelta(hours=2)).isoformat(),
-            "end_time": (end + timedelta(hours=2)).isoformat(),
+            "end_time": (start + timedelta(hours=3)).isoformat(),
         },
         headers={"Authorization": f"Bearer {intruder_token}"},
     )
     assert update_resp.status_code == 403
 
 
-def test_cancel_booking_endpoint_marks_status_cancelled() -> None:
+def test_cancel_booking_endpoint_marks_status_cancelled(
+    client: TestClient, db_session: Session, booking_owner: User, created_booking: int
+) -> None:
     """
     Deleting a booking should set its status to ``cancelled``.
     """
-    _clear_all_bookings()
-    user = _ensure_user("cancel_user")
-
-    with TestingSessionLocal() as db:
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert room is not None
-        room_id = room.id
-    token = _get_token(user.username, user.role, user.id)
-
-    start = (datetime.now() + timedelta(days=43)).replace(microsecond=0)
-    end = start + timedelta(hours=1)
-    resp = client.post(
-        "/api/v1/bookings/",
-        json={
-            "room_id": room_id,
-            "start_time": start.isoformat(),
-            "end_time": end.isoformat(),
-        },
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    booking_id = resp.json()["id"]
+    token = _get_token(booking_owner.username, booking_owner.role, booking_owner.id)
 
     delete_resp = client.delete(
-        f"/api/v1/bookings/{booking_id}",
+        f"/api/v1/bookings/{created_booking}",
         headers={"Authorization": f"Bearer {token}"},
     )
     assert delete_resp.status_code == 204
 
-    with TestingSessionLocal() as db:
-        refreshed = db.query(Booking).get(booking_id)
-        assert refreshed is not None
-        assert refreshed.status == "cancelled"
+    db_session.expire_all()
+    refreshed = db_session.get(Booking, created_booking)
+    assert refreshed is not None
+    assert refreshed.status == "cancelled"
 
 
-def test_create_booking_for_missing_room_returns_400() -> None:
+def test_user_room_booking_exists_endpoint(
+    client: TestClient, booking_owner: User, created_booking: int
+) -> None:
+    """
+    The exists probe should report ``True`` only for the owner's booked room.
+    """
+    admin_token = _get_token("admin_user", "admin", ADMIN_USER_ID)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    hit = client.get(
+        f"/api/v1/admin/bookings/user/{booking_owner.id}/room/{ROOM_E_ID}/exists",
+        headers=headers,
+    )
+    assert hit.status_code == 200, hit.text
+    assert hit.json() == {"exists": True}
+
+    miss = client.get(
+        f"/api/v1/admin/bookings/user/{ADMIN_USER_ID}/room/{ROOM_E_ID}/exists",
+        headers=headers,
+    )
+    assert miss.status_code == 200
+    assert miss.json() == {"exists": False}
+
+
+def test_create_booking_for_missing_room_returns_400(client: TestClient, db_session: Session) -> None:
     """
     Creating a booking for a nonexistent room should return HTTP 400.
     """
-    _clear_all_bookings()
-    user = _ensure_user("missing_room_user")
+    user = _ensure_user(db_session, "missing_room_user")
     token = _get_token(user.username, user.role, user.id)
 
-    start = (datetime.now() + timedelta(days=44)).replace(microsecond=0)
+    start = SLOTS[44]
     end = start + timedelta(hours=1)
     response = client.post(
         "/api/v1/bookings/",
@@ -450,14 +485,14 @@ def test_create_booking_for_missing_room_returns_400() -> None:
     assert "Room does not exist" in response.json()["detail"]
 
 
-def test_update_booking_endpoint_not_found_returns_404() -> None:
+def test_update_booking_endpoint_not_found_returns_404(client: TestClient, db_session: Session) -> None:
     """
     Updating a nonexistent booking id should return HTTP 404.
     """
-    user = _ensure_user("missing_booking_user")
+    user = _ensure_user(db_session, "missing_booking_user")
     token = _get_token(user.username, user.role, user.id)
 
-    start = (datetime.now() + timedelta(days=45)).replace(microsecond=0)
+    start = SLOTS[45]
     end = start + timedelta(hours=1)
     response = client.put(
         "/api/v1/bookings/99999",
@@ -467,20 +502,16 @@ def test_update_booking_endpoint_not_found_returns_404() -> None:
     assert response.status_code == 404
 
 
-def test_update_booking_endpoint_conflict_returns_409() -> None:
+def test_update_booking_endpoint_conflict_returns_409(client: TestClient, db_session: Session) -> None:
     """
     Updating a booking into a conflicting interval should return HTTP 409.
     """
-    _clear_all_bookings()
-    user = _ensure_user("conflict_updater")
+    user = _ensure_user(db_session, "conflict_updater")
     token = _get_token(user.username, user.role, user.id)
 
-    with TestingSessionLocal() as db:
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert room is not None
-        room_id = room.id
+    room_id = ROOM_E_ID
 
-    base_start = (datetime.now() + timedelta(days=46)).replace(microsecond=0)
+    base_start = SLOTS[46]
     base_end = base_start + timedelta(hours=1)
     first = client.post(
         "/api/v1/bookings/",
@@ -515,18 +546,14 @@ def test_update_booking_endpoint_conflict_returns_409() -> None:
     assert conflict_resp.status_code == 409
 
 
-def test_create_booking_endpoint_sends_notification() -> None:
+def test_create_booking_endpoint_sends_notification(client: TestClient, db_session: Session) -> None:
     """
     Creating a booking via endpoint should trigger a notification with correct arguments.
     """
-    _clear_all_bookings()
-    user = _ensure_user("notification_user")
+    user = _ensure_user(db_session, "notification_user")
     
-    with TestingSessionLocal() as db:
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert room is not None
-        room_id = room.id
-        room_name = room.name
+    room_id = ROOM_E_ID
+    room_name = "Room E"
     token = _get_token(username=user.username, role=user.role, user_id=user.id)
     
     # Record arguments passed to notification function
@@ -559,7 +586,7 @@ def test_create_booking_endpoint_sends_notification() -> None:
             "capacity": 8,
         }
         
-        start = (datetime.now() + timedelta(days=50)).replace(microsecond=0)
+        start = SLOTS[50]
         end = start + timedelta(hours=1)
         
         response = client.post(
@@ -587,34 +614,22 @@ def test_create_booking_endpoint_sends_notification() -> None:
         assert call_args["end_time"].isoformat() == end.isoformat()
 
 
-def test_cancel_booking_endpoint_sends_notification() -> None:
+def test_cancel_booking_endpoint_sends_notification(
+    client: TestClient, booking_owner: User, created_booking: int
+) -> None:
     """
     Cancelling a booking via endpoint should trigger a cancellation notification with correct arguments.
     """
-    _clear_all_bookings()
-    user = _ensure_user("cancel_notification_user")
+    user = booking_owner
     
-    with TestingSessionLocal() as db:
-        room = db.query(Room).filter_by(name="Room E").first()
-        assert room is not None
-        room_id = room.id
-        room_name = room.name
+    room_id = ROOM_E_ID
+    room_name = "Room E"
     token = _get_token(username=user.username, role=user.role, user_id=user.id)
     
-    # Create a booking first
-    start = (datetime.now() + timedelta(days=51)).replace(microsecond=0)
+    # The booking made by ``created_booking``
+    start = SLOTS[40]
     end = start + timedelta(hours=1)
-    resp = client.post(
-        "/api/v1/bookings/",
-        json={
-            "room_id": room_id,
-            "start_time": start.isoformat(),
-            "end_time": end.isoformat(),
-        },
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    assert resp.status_code == 201
-    booking_id = resp.json()["id"]
+    booking_id = created_booking
     
     # Record arguments passed to notification function
     notification_calls = []
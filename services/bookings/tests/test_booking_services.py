@@ -3,9 +3,10 @@ Unit tests for the core booking service logic (no HTTP layer).
 """
 
 from datetime import datetime, timedelta
+from typing import Callable, Dict, List
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 import pytest
 import sys
@@ -16,234 +17,78 @@ ROOT_DIR = Path(__file__).resolve().parents[3]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from db.schema import Base, Booking, User, Room
+from db.schema import Booking, User, Room
 from services.bookings.app.service_layer import booking_service
-from unittest.mock import patch, MagicMock
-
-
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_bookings_core.db"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    future=True,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def setup_module(module) -> None:  # noqa: D401
-    """Create tables and seed basic data for all tests in this module."""
-    # Drop and recreate tables to ensure clean state
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    with TestingSessionLocal() as db:
-        db.query(Booking).delete()
-
-        for username, role in (
-            ("alice", "regular"),
-            ("bob", "regular"),
-            ("admin", "admin"),
-        ):
-            if not db.query(User).filter_by(username=username).first():
-                db.add(
-                    User(
-                        name=username.title(),
-                        username=username,
-                        email=f"{username}@example.com",
-                        password_hash="hashed",
-                        role=role,
-                    )
-                )
-
-        for room_name in ("Room A", "Room Z"):
-            if not db.query(Room).filter_by(name=room_name).first():
-                db.add(
-                    Room(
-                        name=room_name,
-                        capacity=10,
-                        equipment="[]",
-                        location="Building A",
-                        status="active",
-                    )
-                )
-        db.commit()
-
-
-def _clear_bookings(db: Session) -> None:
-    db.query(Booking).delete()
-    db.commit()
-
-
-def test_create_booking_without_conflict() -> None:
+
+
+def test_create_booking_without_conflict(
+    seed_ids: Dict[str, int], booking_factory: Callable[..., Booking]
+) -> None:
     """
     Creating a booking in an empty interval should succeed.
     """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-        
-        user = db.query(User).filter_by(username="alice").first()
-        room = db.query(Room).filter_by(name="Room A").first()
-        assert user is not None
-        assert room is not None
-
-        # Use a future date to avoid conflicts with any existing bookings
-        start = datetime.now() + timedelta(days=10)
-        end = start + timedelta(hours=1)
-
-        booking = booking_service.create_booking(
-            db,
-            user_id=user.id,
-            role=user.role,
-            room_id=room.id,
-            start_time=start,
-            end_time=end,
-            force_override=False,
-        )
-        assert isinstance(booking, Booking)
-        assert booking.user_id == user.id
-        assert booking.room_id == room.id
-        assert booking.status == "confirmed"
+    booking = booking_factory()
+    assert isinstance(booking, Booking)
+    assert booking.user_id == seed_ids["alice_id"]
+    assert booking.room_id == seed_ids["room_a_id"]
+    assert booking.status == "confirmed"
 
 
-def test_conflicting_booking_raises_error() -> None:
+def test_conflicting_booking_raises_error(booking_factory: Callable[..., Booking]) -> None:
     """
     Creating a second booking with overlapping interval should raise
     BookingConflictError when override is disabled.
     """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-        
-        user = db.query(User).filter_by(username="alice").first()
-        room = db.query(Room).filter_by(name="Room A").first()
-        assert user is not None
-        assert room is not None
-
-        # Use a future date to avoid conflicts with any existing bookings
-        start = datetime.now() + timedelta(days=11)
-        end = start + timedelta(hours=1)
-
-        # First booking
-        booking_service.create_booking(
-            db,
-            user_id=user.id,
-            role=user.role,
-            room_id=room.id,
-            start_time=start,
-            end_time=end,
-            force_override=False,
-        )
+    first = booking_factory(days=11)
+
+    # Second overlapping booking
+    try:
+        booking_factory(start=first.start_time + timedelta(minutes=30))
+        assert False, "Expected BookingConflictError"
+    except booking_service.BookingConflictError:
+        pass
+
 
-        # Second overlapping booking
-        try:
-            booking_service.create_booking(
-                db,
-                user_id=user.id,
-                role=user.role,
-                room_id=room.id,
-                start_time=start + timedelta(minutes=30),
-                end_time=end + timedelta(minutes=30),
-                force_override=False,
-            )
-            assert False, "Expected BookingConflictError"
-        except booking_service.BookingConflictError:
-            pass
-
-
-def test_admin_override_cancels_conflicts() -> None:
+def test_admin_override_cancels_conflicts(
+    db: Session, seed_ids: Dict[str, int], booking_factory: Callable[..., Booking]
+) -> None:
     """
     When an admin creates a booking with override, conflicting bookings
     should be marked as cancelled.
     """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-        
-        # Seed admin user if needed
-        admin = db.query(User).filter_by(username="admin").first()
-        room = db.query(Room).filter_by(name="Room Z").first()
-        if admin is None:
-            admin = User(
-                name="Admin User",
-                username="admin",
-                email="admin@example.com",
-                password_hash="hashed",
-                role="admin",
-            )
-            db.add(admin)
-            db.commit()
-            db.refresh(admin)
-        assert room is not None
-
-        # Use a future date to avoid conflicts with any existing bookings
-        start = datetime.now() + timedelta(days=12)
-        end = start + timedelta(hours=1)
-
-        # Existing booking
-        existing = booking_service.create_booking(
-            db,
-            user_id=admin.id,
-            role=admin.role,
-            room_id=room.id,
-            start_time=start,
-            end_time=end,
-            force_override=False,
-        )
+    admin = db.get(User, seed_ids["admin_id"])
+    room = db.get(Room, seed_ids["room_z_id"])
 
-        # Admin override overlapping the same interval
-        new_booking = booking_service.create_booking(
-            db,
-            user_id=admin.id,
-            role=admin.role,
-            room_id=room.id,
-            start_time=start + timedelta(minutes=15),
-            end_time=end + timedelta(minutes=15),
-            force_override=True,
-        )
+    existing = booking_factory(user=admin, room=room, days=12)
+
+    # Admin override overlapping the same interval
+    new_booking = booking_factory(
+        user=admin,
+        room=room,
+        start=existing.start_time + timedelta(minutes=15),
+        override=True,
+    )
 
-        db.refresh(existing)
+    status = db.execute(select(Booking.status).where(Booking.id == existing.id)).scalar_one()
 
-        assert existing.status == "cancelled"
-        assert new_booking.status == "confirmed"
-        assert new_booking.id != existing.id
+    assert status == "cancelled"
+    assert new_booking.status == "confirmed"
+    assert new_booking.id != existing.id
 
 
-def test_create_booking_invalid_range_raises_value_error() -> None:
+def test_create_booking_invalid_range_raises_value_error(
+    db: Session, seed_ids: Dict[str, int], now: datetime
+) -> None:
     """
     Creating a booking with an inverted time range should raise ValueError.
     """
-    with TestingSessionLocal() as db:
-        user = db.query(User).filter_by(username="alice").one()
-        room = db.query(Room).filter_by(name="Room A").one()
-        start = datetime.now() + timedelta(days=5)
-        end = start - timedelta(hours=1)
-
-        try:
-            booking_service.create_booking(
-                db,
-                user_id=user.id,
-                role=user.role,
-                room_id=room.id,
-                start_time=start,
-                end_time=end,
-                force_override=False,
-            )
-            assert False, "Expected ValueError for invalid time range"
-        except ValueError:
-            pass
-
-
-def test_update_booking_conflict_detected() -> None:
-    """
-    Updating a booking to overlap another one should raise BookingConflictError.
-    """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
+    user = db.get(User, seed_ids["alice_id"])
+    room = db.get(Room, seed_ids["room_a_id"])
+    start = now + timedelta(days=5)
+    end = start - timedelta(hours=1)
 
-        user = db.query(User).filter_by(username="alice").one()
-        room = db.query(Room).filter_by(name="Room A").one()
-
-        start = datetime.now() + timedelta(days=20)
-        end = start + timedelta(hours=1)
-        first = booking_service.create_booking(
+    try:
+        booking_service.create_booking(
             db,
             user_id=user.id,
             role=user.role,
@@ -252,320 +97,343 @@ def test_update_booking_conflict_detected() -> None:
             end_time=end,
             force_override=False,
         )
+        assert False, "Expected ValueError for invalid time range"
+    except ValueError:
+        pass
 
-        # Second booking to conflict with
-        other = booking_service.create_booking(
-            db,
-            user_id=user.id,
-            role=user.role,
-            room_id=room.id,
-            start_time=start + timedelta(hours=2),
-            end_time=end + timedelta(hours=2),
-            force_override=False,
-        )
 
-        try:
-            booking_service.update_booking_time(
-                db,
-                booking_id=other.id,
-                caller_user_id=user.id,
-                caller_role=user.role,
-                start_time=start,
-                end_time=end,
-            )
-            assert False, "Expected BookingConflictError"
-        except booking_service.BookingConflictError:
-            pass
-
-
-def test_cancel_booking_permission_enforced() -> None:
+def test_update_booking_conflict_detected(
+    db: Session,
+    seed_ids: Dict[str, int],
+    seed_bookings: Callable[[List[dict]], List[Booking]],
+    now: datetime,
+) -> None:
     """
-    A user cannot cancel another user's booking unless they are admin.
+    Updating a booking to overlap another one should raise BookingConflictError.
     """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-
-        alice = db.query(User).filter_by(username="alice").one()
-        bob = db.query(User).filter_by(username="bob").one()
-        room = db.query(Room).filter_by(name="Room Z").one()
+    user = db.get(User, seed_ids["alice_id"])
+    start = now + timedelta(days=20)
+    first, other = seed_bookings(
+        [
+            {
+                "user_id": user.id,
+                "room_id": seed_ids["room_a_id"],
+                "start_time": start + timedelta(hours=offset),
+                "end_time": start + timedelta(hours=offset + 1),
+            }
+            for offset in (0, 2)
+        ]
+    )
 
-        start = datetime.now() + timedelta(days=25)
-        end = start + timedelta(hours=1)
-        victim = booking_service.create_booking(
+    try:
+        booking_service.update_booking_time(
             db,
-            user_id=alice.id,
-            role=alice.role,
-            room_id=room.id,
-            start_time=start,
-            end_time=end,
-            force_override=False,
+            booking_id=other.id,
+            caller_user_id=user.id,
+            caller_role=user.role,
+            start_time=first.start_time,
+            end_time=first.end_time,
         )
+        assert False, "Expected BookingConflictError"
+    except booking_service.BookingConflictError:
+        pass
+
 
-        try:
-            booking_service.cancel_booking(
-                db,
-                booking_id=victim.id,
-                caller_user_id=bob.id,
-                caller_role=bob.role,
-                force=False,
-            )
-            assert False, "Expected BookingPermissionError"
-        except booking_service.BookingPermissionError:
-            pass
-
-        # Admin force cancel should succeed
-        admin = db.query(User).filter_by(username="admin").first()
-        if admin is None:
-            admin = User(
-                name="Admin",
-                username="admin",
-                email="admin2@example.com",
-                password_hash="hashed",
-                role="admin",
-            )
-            db.add(admin)
-            db.commit()
-            db.refresh(admin)
-
-        cancelled = booking_service.cancel_booking(
+def test_cancel_booking_permission_enforced(
+    db: Session, seed_ids: Dict[str, int], booking_factory: Callable[..., Booking]
+) -> None:
+    """
+    A user cannot cancel another user's booking unless they are admin.
+    """
+    bob = db.get(User, seed_ids["bob_id"])
+    victim = booking_factory(room=db.get(Room, seed_ids["room_z_id"]), days=25)
+
+    try:
+        booking_service.cancel_booking(
             db,
             booking_id=victim.id,
-            caller_user_id=admin.id,
-            caller_role=admin.role,
-            force=True,
+            caller_user_id=bob.id,
+            caller_role=bob.role,
+            force=False,
         )
-        assert cancelled.status == "cancelled"
-
-
-def test_create_booking_nonexistent_room_raises_value_error() -> None:
+        assert False, "Expected BookingPermissionError"
+    except booking_service.BookingPermissionError:
+        pass
+
+    # Admin force cancel should succeed
+    admin = db.get(User, seed_ids["admin_id"])
+
+    cancelled = booking_service.cancel_booking(
+        db,
+        booking_id=victim.id,
+        caller_user_id=admin.id,
+        caller_role=admin.role,
+        force=True,
+    )
+    assert cancelled.status == "cancelled"
+
+
+def test_create_booking_nonexistent_room_raises_value_error(
+    db: Session, seed_ids: Dict[str, int], now: datetime
+) -> None:
     """
     The service should reject bookings for rooms that do not exist.
     """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-        user = db.query(User).filter_by(username="alice").one()
-        start = datetime.now() + timedelta(days=2)
-        end = start + timedelta(hours=1)
-
-        with pytest.raises(ValueError, match="Room does not exist"):
-            booking_service.create_booking(
-                db,
-                user_id=user.id,
-                role=user.role,
-                room_id=9999,
-                start_time=start,
-                end_time=end,
-                force_override=False,
-            )
-
-
-def test_create_booking_nonexistent_user_raises_value_error() -> None:
-    """
-    The service should reject bookings for users that do not exist.
-    """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-        room = db.query(Room).filter_by(name="Room A").one()
-        start = datetime.now() + timedelta(days=3)
-        end = start + timedelta(hours=1)
-
-        with pytest.raises(ValueError, match="User does not exist"):
-            booking_service.create_booking(
-                db,
-                user_id=9999,
-                role="regular",
-                room_id=room.id,
-                start_time=start,
-                end_time=end,
-                force_override=False,
-            )
-
-
-def test_update_booking_different_room_no_conflict() -> None:
-    """
-    Updating a booking should only check conflicts within the same room.
-    """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-        user = db.query(User).filter_by(username="alice").one()
-        room_a = db.query(Room).filter_by(name="Room A").one()
-        room_z = db.query(Room).filter_by(name="Room Z").one()
-
-        start = datetime.now() + timedelta(days=5)
-        end = start + timedelta(hours=1)
-        first = booking_service.create_booking(
+    user = db.get(User, seed_ids["alice_id"])
+    start = now + timedelta(days=2)
+    end = start + timedelta(hours=1)
+
+    with pytest.raises(ValueError, match="Room does not exist"):
+        booking_service.create_booking(
             db,
             user_id=user.id,
             role=user.role,
-            room_id=room_a.id,
+            room_id=9999,
             start_time=start,
             end_time=end,
             force_override=False,
         )
 
-        second = booking_service.create_booking(
-            db,
-            user_id=user.id,
-            role=user.role,
-            room_id=room_z.id,
-            start_time=start + timedelta(hours=2),
-            end_time=end + timedelta(hours=2),
-            force_override=False,
-        )
 
-        # Update second booking to overlap the first booking's window.
-        updated = booking_service.update_booking_time(
+def test_create_booking_nonexistent_user_raises_value_error(
+    db: Session, seed_ids: Dict[str, int], now: datetime
+) -> None:
+    """
+    The service should reject bookings for users that do not exist.
+    """
+    room = db.get(Room, seed_ids["room_a_id"])
+    start = now + timedelta(days=3)
+    end = start + timedelta(hours=1)
+
+    with pytest.raises(ValueError, match="User does not exist"):
+        booking_service.create_booking(
             db,
-            booking_id=second.id,
-            caller_user_id=user.id,
-            caller_role=user.role,
-            start_time=start + timedelta(minutes=15),
-            end_time=end + timedelta(minutes=15),
+            user_id=9999,
+            role="regular",
+            room_id=room.id,
+            start_time=start,
+            end_time=end,
+            force_override=False,
         )
 
-        assert updated.id == second.id
-        assert updated.start_time == start + timedelta(minutes=15)
-        assert updated.room_id == room_z.id
 
-
-def test_create_booking_sends_notification() -> None:
+def test_update_booking_different_room_no_conflict(
+    db: Session,
+    seed_ids: Dict[str, int],
+    seed_bookings: Callable[[List[dict]], List[Booking]],
+    now: datetime,
+) -> None:
+    """
+    Updating a booking should only check conflicts within the same room.
+    """
+    user = db.get(User, seed_ids["alice_id"])
+    room_z = db.get(Room, seed_ids["room_z_id"])
+
+    start = now + timedelta(days=5)
+    end = start + timedelta(hours=1)
+    _, second = seed_bookings(
+        [
+            {"user_id": user.id, "room_id": seed_ids["room_a_id"], "start_time": start, "end_time": end},
+            {
+                "user_id": user.id,
+                "room_id": room_z.id,
+                "start_time": start + timedelta(hours=2),
+                "end_time": end + timedelta(hours=2),
+            },
+        ]
+    )
+
+    # Update second booking to overlap the first booking's window.
+    updated = booking_service.update_booking_time(
+        db,
+        booking_id=second.id,
+        caller_user_id=user.id,
+        caller_role=user.role,
+        start_time=start + timedelta(minutes=15),
+        end_time=end + timedelta(minutes=15),
+    )
+
+    assert updated.id == second.id
+    assert updated.start_time == start + timedelta(minutes=15)
+    assert updated.room_id == room_z.id
+
+
+def test_is_room_available_reflects_overlaps(
+    db: Session,
+    seed_ids: Dict[str, int],
+    booking_factory: Callable[..., Booking],
+    now: datetime,
+) -> None:
+    """
+    Availability should be ``False`` only while a non-cancelled booking overlaps.
+    """
+    user = db.get(User, seed_ids["alice_id"])
+    room = db.get(Room, seed_ids["room_a_id"])
+
+    start = now + timedelta(days=15)
+    end = start + timedelta(hours=1)
+    assert booking_service.is_room_available(db, room_id=room.id, start_time=start, end_time=end)
+
+    booking = booking_factory(start=start)
+    assert not booking_service.is_room_available(
+        db,
+        room_id=room.id,
+        start_time=start + timedelta(minutes=30),
+        end_time=end + timedelta(minutes=30),
+    )
+    assert booking_service.is_room_available(
+        db,
+        room_id=room.id,
+        start_time=end,
+        end_time=end + timedelta(hours=1),
+    )
+
+    booking_service.cancel_booking(
+        db,
+        booking_id=booking.id,
+        caller_user_id=user.id,
+        caller_role=user.role,
+    )
+    assert booking_service.is_room_available(db, room_id=room.id, start_time=start, end_time=end)
+
+
+def test_room_availability_batches_rooms(
+    db: Session,
+    seed_ids: Dict[str, int],
+    booking_factory: Callable[..., Booking],
+    now: datetime,
+) -> None:
+    """
+    The batch check should match :func:`is_room_available` for every room asked about.
+    """
+    room_a, room_z = seed_ids["room_a_id"], seed_ids["room_z_id"]
+    start = now + timedelta(days=16)
+    booking_factory(start=start)
+
+    availability = booking_service.room_availability(
+        db,
+        room_ids=[room_z, room_a],
+        start_time=start,
+        end_time=start + timedelta(hours=1),
+    )
+    assert availability == {room_z: True, room_a: False}
+    assert list(availability) == [room_z, room_a]
+
+
+def test_bookings_summary_cache_invalidated_on_writes(
+    db: Session, seed_ids: Dict[str, int], booking_factory: Callable[..., Booking]
+) -> None:
+    """
+    The cached summary must reflect bookings created or cancelled since the last read.
+    """
+    user = db.get(User, seed_ids["alice_id"])
+
+    before = booking_service.get_bookings_summary(db)
+
+    booking = booking_factory(days=16)
+    after_create = booking_service.get_bookings_summary(db)
+    assert after_create["total_bookings"] == before["total_bookings"] + 1
+    assert after_create["confirmed_bookings"] == before["confirmed_bookings"] + 1
+
+    booking_service.cancel_booking(
+        db,
+        booking_id=booking.id,
+        caller_user_id=user.id,
+        caller_role=user.role,
+    )
+    after_cancel = booking_service.get_bookings_summary(db)
+    assert after_cancel["cancelled_bookings"] == before["cancelled_bookings"] + 1
+
+
+def test_create_booking_sends_notification(
+    db: Session,
+    seed_ids: Dict[str, int],
+    booking_factory: Callable[..., Booking],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """
     Creating a booking should trigger a notification with correct arguments.
     """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-        
-        user = db.query(User).filter_by(username="alice").first()
-        room = db.query(Room).filter_by(name="Room A").first()
-        assert user is not None
-        assert room is not None
-        
-        # Record arguments passed to notification function
-        notification_calls = []
-        
-        def fake_notification(user_email, room_name, start_time, end_time):
-            """Fake notification function that records arguments."""
-            notification_calls.append({
-                "user_email": user_email,
-                "room_name": room_name,
-                "start_time": start_time,
-                "end_time": end_time,
-            })
-        
-        # Mock the clients to return user and room data
-        with patch("services.bookings.app.service_layer.booking_service.users_client.get_user") as mock_get_user, \
-             patch("services.bookings.app.service_layer.booking_service.rooms_client.get_room") as mock_get_room, \
-             patch("services.bookings.app.service_layer.booking_service.send_booking_created_notification", side_effect=fake_notification):
-            
-            mock_get_user.return_value = {
-                "id": user.id,
-                "email": user.email,
-                "name": user.name,
-                "username": user.username,
-            }
-            mock_get_room.return_value = {
-                "id": room.id,
-                "name": room.name,
-                "location": room.location,
-                "capacity": room.capacity,
-            }
-            
-            # Use a future date to avoid conflicts
-            start = datetime.now() + timedelta(days=30)
-            end = start + timedelta(hours=1)
-            
-            booking = booking_service.create_booking(
-                db,
-                user_id=user.id,
-                role=user.role,
-                room_id=room.id,
-                start_time=start,
-                end_time=end,
-                force_override=False,
-            )
-            
-            # Assert notification was called once
-            assert len(notification_calls) == 1
-            
-            # Assert correct arguments
-            call_args = notification_calls[0]
-            assert call_args["user_email"] == user.email
-            assert call_args["room_name"] == room.name
-            assert call_args["start_time"] == booking.start_time
-            assert call_args["end_time"] == booking.end_time
-
-
-def test_cancel_booking_sends_notification() -> None:
+    user = db.get(User, seed_ids["alice_id"])
+    room = db.get(Room, seed_ids["room_a_id"])
+    assert user is not None
+    assert room is not None
+
+    # Record arguments passed to notification function
+    notification_calls = []
+
+    def fake_notification(user_email, room_name, start_time, end_time):
+        """Fake notification function that records arguments."""
+        notification_calls.append({
+            "user_email": user_email,
+            "room_name": room_name,
+            "start_time": start_time,
+            "end_time": end_time,
+        })
+
+    # User and room data come from the conftest client stubs
+    monkeypatch.setattr(booking_service, "send_booking_created_notification", fake_notification)
+
+    booking = booking_factory(user=user, room=room, days=30)
+
+    # Assert notification was called once
+    assert len(notification_calls) == 1
+
+    # Assert correct arguments
+    call_args = notification_calls[0]
+    assert call_args["user_email"] == user.email
+    assert call_args["room_name"] == room.name
+    assert call_args["start_time"] == booking.start_time
+    assert call_args["end_time"] == booking.end_time
+
+
+def test_cancel_booking_sends_notification(
+    db: Session,
+    seed_ids: Dict[str, int],
+    booking_factory: Callable[..., Booking],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """
     Cancelling a booking should trigger a cancellation notification with correct arguments.
     """
-    with TestingSessionLocal() as db:
-        _clear_bookings(db)
-        
-        user = db.query(User).filter_by(username="alice").first()
-        room = db.query(Room).filter_by(name="Room A").first()
-        assert user is not None
-        assert room is not None
-        
-        # Record arguments passed to notification function
-        notification_calls = []
-        
-        def fake_notification(user_email, room_name, start_time, end_time):
-            """Fake notification function that records arguments."""
-            notification_calls.append({
-                "user_email": user_email,
-                "room_name": room_name,
-                "start_time": start_time,
-                "end_time": end_time,
-            })
-        
-        # Create a booking first
-        start = datetime.now() + timedelta(days=31)
-        end = start + timedelta(hours=1)
-        
-        booking = booking_service.create_booking(
-            db,
-            user_id=user.id,
-            role=user.role,
-            room_id=room.id,
-            start_time=start,
-            end_time=end,
-            force_override=False,
-        )
-        
-        # Mock the clients to return user and room data
-        with patch("services.bookings.app.service_layer.booking_service.users_client.get_user") as mock_get_user, \
-             patch("services.bookings.app.service_layer.booking_service.rooms_client.get_room") as mock_get_room, \
-             patch("services.bookings.app.service_layer.booking_service.send_booking_cancelled_notification", side_effect=fake_notification):
-            
-            mock_get_user.return_value = {
-                "id": user.id,
-                "email": user.email,
-                "name": user.name,
-                "username": user.username,
-            }
-            mock_get_room.return_value = {
-                "id": room.id,
-                "name": room.name,
-                "location": room.location,
-                "capacity": room.capacity,
-            }
-            
-            # Cancel the booking
-            cancelled_booking = booking_service.cancel_booking(
-                db,
-                booking_id=booking.id,
-                caller_user_id=user.id,
-                caller_role=user.role,
-                force=False,
-            )
-            
-            # Assert notification was called once
-            assert len(notification_calls) == 1
-            
-            # Assert correct arguments
-            call_args = notification_calls[0]
-            assert call_args["user_email"] == user.email
-            assert call_args["room_name"] == room.name
-            assert call_args["start_time"] == cancelled_booking.start_time
-            assert call_args["end_time"] == cancelled_booking.end_time
+    user = db.get(User, seed_ids["alice_id"])
+    room = db.get(Room, seed_ids["room_a_id"])
+    assert user is not None
+    assert room is not None
+
+    # Record arguments passed to notification function
+    notification_calls = []
+
+    def fake_notification(user_email, room_name, start_time, end_time):
+        """Fake notification function that records arguments."""
+        notification_calls.append({
+            "user_email": user_email,
+            "room_name": room_name,
+            "start_time": start_time,
+            "end_time": end_time,
+        })
+
+    # Create a booking first
+    booking = booking_factory(user=user, room=room, days=31)
+
+    # User and room data come from the conftest client stubs
+    monkeypatch.setattr(booking_service, "send_booking_cancelled_notification", fake_notification)
+
+    # Cancel the booking
+    cancelled_booking = booking_service.cancel_booking(
+        db,
+        booking_id=booking.id,
+        caller_user_id=user.id,
+        caller_role=user.role,
+        force=False,
+    )
+
+    # Assert notification was called once
+    assert len(notification_calls) == 1
+
+    # Assert correct arguments
+    call_args = notification_calls[0]
+    assert call_args["user_email"] == user.email
+    assert call_args["room_name"] == room.name
+    assert call_args["start_time"] == cancelled_booking.start_time
+    assert call_args["end_time"] == cancelled_booking.end_time
@@ -4,14 +4,39 @@ Bookings service client for the Reviews service.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Tuple
+
 import httpx
 
 from common.config import get_settings
 from common.http_client import ServiceHTTPClient
 from common.logging_utils import get_logger
 from common.service_account import get_service_account_token
+from common.ttl_cache import TTLCache
 
 _logger = get_logger(__name__)
+settings = get_settings()
+
+# Recent positive answers, so a user posting or editing several reviews of
+# the same room needs one lookup per TTL window. Negative answers are not
+# cached: the user may book the room later.
+BOOKING_EXISTS_CACHE_TTL_SECONDS = 60.0
+BOOKING_EXISTS_CACHE_MAXSIZE = 10_000
+_known_bookers: TTLCache[Tuple[int, int], bool] = TTLCache(
+    BOOKING_EXISTS_CACHE_TTL_SECONDS, BOOKING_EXISTS_CACHE_MAXSIZE
+)
+
+
+@lru_cache(maxsize=4)
+def _client(base_url: str, timeout: float) -> ServiceHTTPClient:
+    """
+    Return the shared Bookings client for ``base_url``.
+
+    The bearer token is attached per request rather than baked into the
+    client, so the cached instance survives service-account token refreshes.
+    """
+    return ServiceHTTPClient(base_url, timeout=timeout, service_name="bookings")
 
 
 def user_has_booking_for_room(user_id: int, room_id: int) -> bool:
@@ -20,21 +45,21 @@ def user_has_booking_for_room(user_id: int, room_id: int) -> bool:
 
     Falls back to ``True`` when stub fallback is enabled.
     """
-    settings = get_settings()
     if settings.client_stub_fallback:
         return True
-    token = get_service_account_token()
-    client = ServiceHTTPClient(
-        settings.bookings_service_url,
-        timeout=settings.http_client_timeout,
-        default_headers={"Authorization": f"Bearer {token}"},
-        service_name="bookings",
-    )
+    if _known_bookers.get((user_id, room_id)):
+        return True
+    client = _client(settings.bookings_service_url, settings.http_client_timeout)
+    headers = {"Authorization": f"Bearer {get_service_account_token()}"}
     try:
-        resp = client.get(f"/api/v1/admin/bookings/user/{user_id}/room/{room_id}")
+        resp = client.get(
+            f"/api/v1/admin/bookings/user/{user_id}/room/{room_id}/exists", headers=headers
+        )
         resp.raise_for_status()
-        data = resp.json()
-        return len(data) > 0
+        exists = bool(resp.json().get("exists", False))
+        if exists:
+            _known_bookers.set((user_id, room_id), True)
+        return exists
     except httpx.HTTPError as exc:
         if settings.client_stub_fallback:
             _logger.warning("Fallback allow for booking check user=%s room=%s: %s", user_id, room_id, exc)
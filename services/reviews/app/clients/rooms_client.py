@@ -4,14 +4,52 @@ Rooms service client for the Reviews service.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import httpx
 
 from common.config import get_settings
 from common.http_client import ServiceHTTPClient
 from common.logging_utils import get_logger
 from common.service_account import get_service_account_token
+from common.ttl_cache import TTLCache
 
 _logger = get_logger(__name__)
+settings = get_settings()
+
+# Room status answers are reused for a short window so listing or moderating
+# many reviews of one room costs a single Rooms round-trip per TTL.
+ROOM_STATUS_CACHE_TTL_SECONDS = 30.0
+# Missing or inactive rooms are re-checked sooner so they become reviewable
+# shortly after being created or reactivated.
+ROOM_UNAVAILABLE_CACHE_TTL_SECONDS = 10.0
+ROOM_STATUS_CACHE_MAXSIZE = 1024
+_room_status_cache: TTLCache[int, bool] = TTLCache(ROOM_STATUS_CACHE_TTL_SECONDS, ROOM_STATUS_CACHE_MAXSIZE)
+
+
+def invalidate_room(room_id: int) -> None:
+    """
+    Forget the cached status of ``room_id`` so the next check asks Rooms.
+    """
+    _room_status_cache.pop(room_id)
+
+
+def _remember_room_status(room_id: int, active: bool) -> bool:
+    """
+    Cache ``active`` for ``room_id`` and hand it back to the caller.
+    """
+    ttl = ROOM_STATUS_CACHE_TTL_SECONDS if active else ROOM_UNAVAILABLE_CACHE_TTL_SECONDS
+    return _room_status_cache.set(room_id, active, ttl)
+
+
+@lru_cache(maxsize=4)
+def _client(base_url: str, timeout: float) -> ServiceHTTPClient:
+    """
+    Return the shared Rooms client for ``base_url``.
+
+    Authorization is passed on each call, not stored on the client.
+    """
+    return ServiceHTTPClient(base_url, timeout=timeout, service_name="rooms")
 
 
 def ensure_room_is_active(room_id: int) -> bool:
@@ -20,23 +58,20 @@ def ensure_room_is_active(room_id: int) -> bool:
 
     Falls back to ``True`` when stub fallback is enabled.
     """
-    settings = get_settings()
     if settings.client_stub_fallback:
         return True
-    token = get_service_account_token()
-    client = ServiceHTTPClient(
-        settings.rooms_service_url,
-        timeout=settings.http_client_timeout,
-        default_headers={"Authorization": f"Bearer {token}"},
-        service_name="rooms",
-    )
+    cached = _room_status_cache.get(room_id)
+    if cached is not None:
+        return cached
+    client = _client(settings.rooms_service_url, settings.http_client_timeout)
+    headers = {"Authorization": f"Bearer {get_service_account_token()}"}
     try:
-        resp = client.get(f"/api/v1/rooms/{room_id}")
+        resp = client.get(f"/api/v1/rooms/{room_id}", headers=headers)
         if resp.status_code == 404:
-            return False
+            return _remember_room_status(room_id, False)
         resp.raise_for_status()
         data = resp.json()
-        return data.get("status", "active") == "active"
+        return _remember_room_status(room_id, data.get("status", "active") == "active")
     except httpx.HTTPError as exc:
         if settings.client_stub_fallback:
             _logger.warning("Fallback allow for room existence (%s): %s", room_id, exc)
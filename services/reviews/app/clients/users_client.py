@@ -4,14 +4,42 @@ Users service client for the Reviews service.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import httpx
 
 from common.config import get_settings
 from common.http_client import ServiceHTTPClient
 from common.logging_utils import get_logger
 from common.service_account import get_service_account_token
+from common.ttl_cache import TTLCache
 
 _logger = get_logger(__name__)
+settings = get_settings()
+
+# Recent existence answers, so a burst of reviews by the same author (or
+# client retries for an unknown one) needs one lookup per TTL window.
+# Misses expire sooner so newly registered users show up quickly.
+USER_EXISTS_CACHE_TTL_SECONDS = 60.0
+USER_MISSING_CACHE_TTL_SECONDS = 10.0
+USER_EXISTS_CACHE_MAXSIZE = 10_000
+_user_lookups: TTLCache[int, bool] = TTLCache(USER_EXISTS_CACHE_TTL_SECONDS, USER_EXISTS_CACHE_MAXSIZE)
+
+
+def _remember_user(user_id: int, exists: bool) -> bool:
+    """
+    Cache whether ``user_id`` exists and hand the answer back.
+    """
+    ttl = USER_EXISTS_CACHE_TTL_SECONDS if exists else USER_MISSING_CACHE_TTL_SECONDS
+    return _user_lookups.set(user_id, exists, ttl)
+
+
+@lru_cache(maxsize=4)
+def _client(base_url: str, timeout: float) -> ServiceHTTPClient:
+    """
+    Return the shared Users client for ``base_url``.
+    """
+    return ServiceHTTPClient(base_url, timeout=timeout, service_name="users")
 
 
 def ensure_user_exists(user_id: int) -> bool:
@@ -20,22 +48,23 @@ def ensure_user_exists(user_id: int) -> bool:
 
     Falls back to ``True`` when stub fallback is enabled.
     """
-    settings = get_settings()
     if settings.client_stub_fallback:
         return True
-    token = get_service_account_token()
-    client = ServiceHTTPClient(
-        settings.users_service_url,
-        timeout=settings.http_client_timeout,
-        default_headers={"Authorization": f"Bearer {token}"},
-        service_name="users",
-    )
+    cached = _user_lookups.get(user_id)
+    if cached is not None:
+        return cached
+    client = _client(settings.users_service_url, settings.http_client_timeout)
+    path = f"/api/v1/users/id/{user_id}"
     try:
-        resp = client.get(f"/api/v1/users/id/{user_id}")
+        resp = client.get(path, headers={"Authorization": f"Bearer {get_service_account_token()}"})
+        if resp.status_code == 401:
+            # The cached service-account token was rejected; mint a new one once.
+            token = get_service_account_token(force_refresh=True)
+            resp = client.get(path, headers={"Authorization": f"Bearer {token}"})
         if resp.status_code == 404:
-            return False
+            return _remember_user(user_id, False)
         resp.raise_for_status()
-        return True
+        return _remember_user(user_id, True)
     except httpx.HTTPError as exc:
         if settings.client_stub_fallback:
             _logger.warning("Fallback allow for user existence (%s): %s", user_id, exc)
@@ -10,16 +10,20 @@ This module defines:
 
 from __future__ import annotations
 
+import hashlib
+import time
+from dataclasses import dataclass
 from typing import Generator
 
 from fastapi import Depends, Request, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from pydantic import BaseModel
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from common.auth import decode_access_token
+from common.auth import get_jwt_validator
 from common.config import get_settings
+from common.db import engine_pool_options
+from db.schema import Review
 from common.rbac import (
     ROLE_ADMIN,
     ROLE_MODERATOR,
@@ -28,16 +32,39 @@ from common.rbac import (
     ROLE_FACILITY_MANAGER,
     has_role,
 )
-from common.exceptions import UnauthorizedError, ForbiddenError
+from common.exceptions import UnauthorizedError, ForbiddenError, NotFoundError
 from common.rate_limiter import check_rate_limit
+from common.ttl_cache import TTLCache
 
 # ---------------------------------------------------------------------------
 # Database session factory
 # ---------------------------------------------------------------------------
 
 settings = get_settings()
-engine = create_engine(settings.database_url, future=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+engine = create_engine(settings.database_url, future=True, **engine_pool_options(settings.database_url))
+# Sessions live for one request. Keeping attributes loaded after commit lets
+# handlers return the rows they just wrote without re-selecting them.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+# Analytics aggregates scan whole tables; when a replica is configured they
+# run there on a small pool of their own instead of competing with writes.
+if settings.analytics_database_url:
+    _analytics_pool_options = {}
+    if not settings.analytics_database_url.startswith("sqlite"):
+        _analytics_pool_options = {
+            "pool_size": 5,
+            "pool_pre_ping": True,
+            "pool_use_lifo": True,
+        }
+    analytics_engine = create_engine(
+        settings.analytics_database_url, future=True, **_analytics_pool_options
+    )
+    AnalyticsSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=analytics_engine)
+else:
+    analytics_engine = engine
+    AnalyticsSessionLocal = SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -51,16 +78,78 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_analytics_db() -> Generator[Session, None, None]:
+    """
+    Yield a read session for analytics, on the replica when one is configured.
+    """
+    db = AnalyticsSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_review_or_404(review_id: int, db: Session = Depends(get_db)) -> Review:
+    """
+    Load the review named by the ``review_id`` path parameter.
+
+    Raises :class:`NotFoundError` if it does not exist. Routes must declare
+    their auth dependency before this one so that unauthenticated or
+    unauthorized callers get 401/403 rather than learning which ids exist.
+    """
+    review = db.get(Review, review_id)
+    if review is None:
+        raise NotFoundError("Review not found.", error_code="REVIEW_NOT_FOUND")
+    return review
+
+
 # ---------------------------------------------------------------------------
 # Authentication / Authorization helpers
 # ---------------------------------------------------------------------------
 
 security_scheme = HTTPBearer(auto_error=True)
 
+# Role groups checked on every request, built once.
+_ELEVATED_ROLES = frozenset({ROLE_ADMIN, ROLE_MODERATOR})
+_ADMIN_ROLES = frozenset({ROLE_ADMIN})
+_READ_ROLES = frozenset(
+    {ROLE_ADMIN, ROLE_MODERATOR, ROLE_AUDITOR, ROLE_REGULAR, ROLE_FACILITY_MANAGER}
+)
+
+# Verified token payloads, keyed by a digest of the raw token. Clients reuse
+# one bearer token for many requests, so signature checks are skipped while
+# an entry is fresh. Entries never outlive the token's own ``exp`` claim and
+# failed decodes are not stored.
+TOKEN_CACHE_TTL_SECONDS = 30.0
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: TTLCache[bytes, dict] = TTLCache(TOKEN_CACHE_TTL_SECONDS, TOKEN_CACHE_MAXSIZE)
+_jwt_validator = get_jwt_validator()
+
 
-class CurrentUser(BaseModel):
+def _decode_token_cached(token: str) -> dict:
+    """
+    Return the verified payload of ``token``, decoding it only on a cache miss.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        return cached
+
+    payload = _jwt_validator.decode(token)
+    ttl = TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, exp - time.time())
+    return _token_cache.set(key, payload, ttl)
+
+
+@dataclass(slots=True, frozen=True)
+class CurrentUser:
     """
     Minimal representation of the authenticated user used by this service.
+
+    Built once per request from an already verified token, so a plain
+    dataclass is enough; the claims are cast in :func:`get_current_user`.
     """
 
     id: int
@@ -79,7 +168,7 @@ def get_current_user(
     """
     token = credentials.credentials
     try:
-        payload = decode_access_token(token)
+        payload = _decode_token_cached(token)
     except Exception:  # noqa: BLE001
         raise UnauthorizedError("Invalid authentication token.")
 
@@ -111,7 +200,7 @@ def require_moderator_or_admin(
     This dependency can be injected into endpoints that are restricted
     to review moderation personnel.
     """
-    if not has_role(user.role, [ROLE_ADMIN, ROLE_MODERATOR]):
+    if not has_role(user.role, _ELEVATED_ROLES):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not have permission to moderate reviews.",
@@ -128,7 +217,7 @@ def require_admin_only(
     This dependency is for admin-only operations like deleting/restoring reviews
     and viewing all reviews in the system.
     """
-    if not has_role(user.role, [ROLE_ADMIN]):
+    if not has_role(user.role, _ADMIN_ROLES):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="This operation requires admin privileges.",
@@ -140,10 +229,7 @@ def require_read_access(user: CurrentUser = Depends(get_current_user)) -> Curren
     """
     Allow any authenticated user with read privileges (including auditor).
     """
-    if not has_role(
-        user.role,
-        [ROLE_ADMIN, ROLE_MODERATOR, ROLE_AUDITOR, ROLE_REGULAR, ROLE_FACILITY_MANAGER],
-    ):
+    if not has_role(user.role, _READ_ROLES):
         raise ForbiddenError("You do not have permission to view reviews.")
     return user
 
@@ -157,7 +243,7 @@ def allow_owner_or_admin_or_moderator(
     """
     if current.id == review_user_id:
         return
-    if has_role(current.role, [ROLE_ADMIN, ROLE_MODERATOR]):
+    if has_role(current.role, _ELEVATED_ROLES):
         return
     raise ForbiddenError("You are not allowed to modify this review.")
 
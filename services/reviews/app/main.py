@@ -14,13 +14,16 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
 from common.exceptions import AppError
+from common.threadpool import size_threadpool_to_db_pool
 from .routers import reviews_routes, moderation_routes, admin_routes, analytics_routes
 
 logger = logging.getLogger(__name__)
 
+
 app = FastAPI(
     title="Smart Meeting Room - Reviews Service",
     version="0.1.0",
+    lifespan=size_threadpool_to_db_pool,
 )
 
 
@@ -8,57 +8,88 @@ logic and HTTP concerns.
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_, update
 
 from db.schema import Review
 
+# Columns exposed by ``schemas.ReviewRead``. List endpoints select just these
+# and return plain dicts, skipping ORM instance construction for rows that are
+# only serialized.
+_REVIEW_READ_COLUMNS = (
+    Review.id,
+    Review.user_id,
+    Review.room_id,
+    Review.rating,
+    Review.comment,
+    Review.is_flagged,
+    Review.is_visible,
+    Review.created_at,
+)
+
+
+def _fetch_review_rows(db: Session, stmt) -> List[dict]:
+    """
+    Execute a review projection and return each row as a dict.
+    """
+    return [dict(row) for row in db.execute(stmt).mappings()]
+
 
 def get_review_by_id(db: Session, review_id: int) -> Optional[Review]:
     """
     Retrieve a single review by its primary key.
+
+    Uses the session identity map, so repeated lookups within one request
+    do not issue another SELECT.
     """
-    return db.query(Review).filter(Review.id == review_id).first()
+    return db.get(Review, review_id)
 
 
-def list_reviews_for_room(db: Session, room_id: int) -> List[Review]:
+def list_reviews_for_room(
+    db: Session,
+    room_id: int,
+    *,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: int = 50,
+) -> List[dict]:
     """
-    Return all reviews for a given room ordered by creation time.
+    Return one page of reviews for a given room ordered by creation time.
+
+    Pages are keyset-based: pass the ``created_at`` and ``id`` of the last
+    review already seen to get the reviews that follow it.
     """
-    return (
-        db.query(Review)
-        .filter(Review.room_id == room_id)
-        .order_by(Review.created_at.asc())
-        .all()
-    )
+    stmt = select(*_REVIEW_READ_COLUMNS).where(Review.room_id == room_id)
+    if after_created_at is not None and after_id is not None:
+        stmt = stmt.where(tuple_(Review.created_at, Review.id) > (after_created_at, after_id))
+    stmt = stmt.order_by(Review.created_at.asc(), Review.id.asc()).limit(limit)
+    return _fetch_review_rows(db, stmt)
 
 
-def list_flagged_reviews(db: Session) -> List[Review]:
+def list_flagged_reviews(db: Session) -> List[dict]:
     """
     Return all reviews that are currently flagged.
     """
-    return (
-        db.query(Review)
-        .filter(Review.is_flagged.is_(True))
+    stmt = (
+        select(*_REVIEW_READ_COLUMNS)
+        .where(Review.is_flagged.is_(True))
         .order_by(Review.created_at.asc())
-        .all()
     )
+    return _fetch_review_rows(db, stmt)
 
 
-def list_all_reviews(db: Session) -> List[Review]:
+def list_all_reviews(db: Session) -> List[dict]:
     """
-    Return all reviews in the system ordered by creation time.
+    Return all reviews in the system ordered by creation time (newest first).
     """
-    return (
-        db.query(Review)
-        .order_by(Review.created_at.desc())
-        .all()
-    )
+    stmt = select(*_REVIEW_READ_COLUMNS).order_by(Review.created_at.desc())
+    return _fetch_review_rows(db, stmt)
 
 
-def create_review(
+def create_review_nocommit(
     db: Session,
     *,
     user_id: int,
@@ -67,7 +98,9 @@ def create_review(
     comment: str,
 ) -> Review:
     """
-    Insert a new review into the database.
+    Stage a new review and flush it so its primary key is assigned.
+
+    The caller owns the transaction and decides when to commit.
     """
     review = Review(
         user_id=user_id,
@@ -78,49 +111,96 @@ def create_review(
         is_visible=True,
     )
     db.add(review)
+    db.flush()
+    return review
+
+
+def create_review(
+    db: Session,
+    *,
+    user_id: int,
+    room_id: int,
+    rating: int,
+    comment: str,
+) -> Review:
+    """
+    Insert a new review into the database and commit.
+    """
+    review = create_review_nocommit(
+        db,
+        user_id=user_id,
+        room_id=room_id,
+        rating=rating,
+        comment=comment,
+    )
     db.commit()
-    db.refresh(review)
     return review
 
 
-def save_review(db: Session, review: Review) -> Review:
+def save_review(db: Session, review: Review, *, refresh: bool = True) -> Review:
     """
     Persist modifications made to an existing review.
+
+    Pass ``refresh=False`` when every changed field was set from Python and
+    the database has nothing new to report, saving a round-trip.
     """
     db.add(review)
     db.commit()
-    db.refresh(review)
+    if refresh:
+        db.refresh(review)
     return review
 
 
-def delete_review(db: Session, review: Review) -> None:
+def set_review_flags(
+    db: Session,
+    review_id: int,
+    *,
+    is_flagged: Optional[bool] = None,
+    is_visible: Optional[bool] = None,
+) -> Optional[dict]:
     """
-    Delete a review from the database.
+    Set the moderation flags of a review in a single ``UPDATE ... RETURNING``.
+
+    Only the flags passed as non-``None`` are written. The row is never
+    loaded into the session; the updated review comes back as a dict with
+    the ``ReviewRead`` columns, or ``None`` if no review has that id.
     """
-    db.delete(review)
+    values = {}
+    if is_flagged is not None:
+        values["is_flagged"] = is_flagged
+    if is_visible is not None:
+        values["is_visible"] = is_visible
+    stmt = (
+        update(Review)
+        .where(Review.id == review_id)
+        .values(**values)
+        .returning(*_REVIEW_READ_COLUMNS)
+    )
+    row = db.execute(stmt).mappings().first()
     db.commit()
+    return dict(row) if row is not None else None
 
 
-def list_all_reviews(db: Session) -> List[Review]:
+def delete_review(db: Session, review: Review) -> None:
     """
-    Return all reviews in the system.
+    Delete a review from the database.
     """
-    return db.query(Review).order_by(Review.created_at.desc()).all()
+    db.delete(review)
+    db.commit()
 
 
 def get_average_rating_by_room(db: Session) -> List[dict]:
     """
     Return average rating and review count grouped by room.
     """
-    rows = (
-        db.query(
-            Review.room_id,
-            func.avg(Review.rating).label("avg_rating"),
-            func.count(Review.id).label("review_count"),
-        )
-        .group_by(Review.room_id)
-        .all()
-    )
+    # ``ix_reviews_room_rating`` holds both columns, so the grouping walks
+    # the index in room order and never reads the table rows.
+    stmt = select(
+        Review.room_id,
+        func.avg(Review.rating).label("avg_rating"),
+        func.count().label("review_count"),
+    ).group_by(Review.room_id)
+    rows = db.execute(stmt).all()
     return [
         {
             "room_id": row.room_id,
@@ -15,19 +15,21 @@ MODERATOR + ADMIN endpoints:
 
 from __future__ import annotations
 
-from typing import List
+from typing import Callable, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.orm import Session
 
+from db.schema import Review
+
 from .. import schemas
 from ..dependencies import (
     CurrentUser,
     get_db,
+    get_review_or_404,
     require_admin_only,
     require_moderator_or_admin,
 )
-from ..repository import reviews_repository
 from ..service_layer import reviews_service
 
 router = APIRouter()
@@ -51,7 +53,7 @@ def list_all_reviews(
     ADMIN-ONLY: This endpoint shows all reviews regardless of visibility or flag status.
     """
     reviews = reviews_service.list_all_reviews(db)
-    return reviews
+    return Response(content=schemas.dump_review_list(reviews), media_type="application/json")
 
 
 @router.get(
@@ -69,7 +71,7 @@ def list_flagged_reviews_admin(
     This is an admin endpoint that mirrors /reviews/flagged for convenience.
     """
     reviews = reviews_service.list_flagged_reviews(db)
-    return reviews
+    return Response(content=schemas.dump_review_list(reviews), media_type="application/json")
 
 
 @router.delete(
@@ -77,9 +79,9 @@ def list_flagged_reviews_admin(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 def delete_review_admin(
-    review_id: int,
-    db: Session = Depends(get_db),
     _: CurrentUser = Depends(require_admin_only),
+    review: Review = Depends(get_review_or_404),
+    db: Session = Depends(get_db),
 ):
     """
     Permanently delete a review from the system.
@@ -87,156 +89,89 @@ def delete_review_admin(
     ADMIN-ONLY: This is a hard delete that removes the review from the database.
     Use hide/show for temporary removal that can be restored.
     """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found.",
-        )
-
-    reviews_repository.delete_review(db, review)
+    reviews_service.delete_review(db, review)
     return None
 
 
-@router.post(
-    "/reviews/{review_id}/restore",
-    response_model=schemas.ReviewRead,
-)
-@router.patch(
-    "/reviews/{review_id}/restore",
-    response_model=schemas.ReviewRead,
-)
-def restore_review(
-    review_id: int,
-    db: Session = Depends(get_db),
-    _: CurrentUser = Depends(require_admin_only),
-):
-    """
-    Restore a hidden review (make it visible again).
-
-    ADMIN-ONLY: This makes a previously hidden review visible to the public again.
-    Supports both POST and PATCH methods.
-    """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found.",
-        )
-
-    review = reviews_service.show_review(db, review)
-    return review
-
-
 # ============================================================================
-# MODERATOR + ADMIN ENDPOINTS
+# STATE-CHANGE ENDPOINTS (restore, flag, unflag, hide, show)
 # ============================================================================
-
-
-@router.api_route(
-    "/reviews/{review_id}/flag",
-    methods=["POST", "PATCH"],
-    response_model=schemas.ReviewRead,
+#
+# These endpoints differ only in the service call and the role guard, so they
+# are generated from one template. Each keeps its own name (and with it its
+# OpenAPI summary and operation id) and docstring. All accept POST and PATCH.
+
+
+def _make_review_action(
+    name: str,
+    action: Callable[[Session, int], dict],
+    guard: Callable[..., CurrentUser],
+    doc: str,
+) -> Callable[..., dict]:
+    """
+    Build the endpoint that applies ``action`` to the addressed review.
+    """
+
+    def endpoint(
+        review_id: int,
+        db: Session = Depends(get_db),
+        _: CurrentUser = Depends(guard),
+    ) -> dict:
+        return action(db, review_id)
+
+    endpoint.__name__ = f"{name}_review"
+    endpoint.__doc__ = doc
+    return endpoint
+
+
+_REVIEW_ACTIONS = (
+    (
+        "restore",
+        reviews_service.show_review,
+        require_admin_only,
+        "Restore a hidden review (make it visible again).\n\n"
+        "ADMIN-ONLY: This makes a previously hidden review visible to the public again.\n"
+        "Supports both POST and PATCH methods.",
+    ),
+    (
+        "flag",
+        reviews_service.flag_review,
+        require_moderator_or_admin,
+        "Mark a review as flagged.\n\n"
+        "MODERATOR + ADMIN: Flag inappropriate or suspicious content for review.\n"
+        "Supports both POST and PATCH methods.",
+    ),
+    (
+        "unflag",
+        reviews_service.unflag_review,
+        require_moderator_or_admin,
+        "Clear the flagged state from a review.\n\n"
+        "MODERATOR + ADMIN: Remove the flag from a review after review.\n"
+        "Supports both POST and PATCH methods.",
+    ),
+    (
+        "hide",
+        reviews_service.hide_review,
+        require_moderator_or_admin,
+        "Hide a review from public view.\n\n"
+        "MODERATOR + ADMIN: Hide a review temporarily. Can be restored by admin.\n"
+        "Supports both POST and PATCH methods.",
+    ),
+    (
+        "show",
+        reviews_service.show_review,
+        require_moderator_or_admin,
+        "Make a hidden review visible again.\n\n"
+        "MODERATOR + ADMIN: Restore visibility of a previously hidden review.\n"
+        "Supports both POST and PATCH methods.",
+    ),
 )
-def flag_review(
-    review_id: int,
-    db: Session = Depends(get_db),
-    _: CurrentUser = Depends(require_moderator_or_admin),
-):
-    """
-    Mark a review as flagged.
-
-    MODERATOR + ADMIN: Flag inappropriate or suspicious content for review.
-    Supports both POST and PATCH methods.
-    """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found.",
-        )
-
-    review = reviews_service.flag_review(db, review)
-    return review
-
-
-@router.api_route(
-    "/reviews/{review_id}/unflag",
-    methods=["POST", "PATCH"],
-    response_model=schemas.ReviewRead,
-)
-def unflag_review(
-    review_id: int,
-    db: Session = Depends(get_db),
-    _: CurrentUser = Depends(require_moderator_or_admin),
-):
-    """
-    Clear the flagged state from a review.
-
-    MODERATOR + ADMIN: Remove the flag from a review after review.
-    Supports both POST and PATCH methods.
-    """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found.",
-        )
-
-    review = reviews_service.unflag_review(db, review)
-    return review
-
-
-@router.api_route(
-    "/reviews/{review_id}/hide",
-    methods=["POST", "PATCH"],
-    response_model=schemas.ReviewRead,
-)
-def hide_review(
-    review_id: int,
-    db: Session = Depends(get_db),
-    _: CurrentUser = Depends(require_moderator_or_admin),
-):
-    """
-    Hide a review from public view.
-
-    MODERATOR + ADMIN: Hide a review temporarily. Can be restored by admin.
-    Supports both POST and PATCH methods.
-    """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found.",
-        )
-
-    review = reviews_service.hide_review(db, review)
-    return review
-
-
-@router.api_route(
-    "/reviews/{review_id}/show",
-    methods=["POST", "PATCH"],
-    response_model=schemas.ReviewRead,
-)
-def show_review(
-    review_id: int,
-    db: Session = Depends(get_db),
-    _: CurrentUser = Depends(require_moderator_or_admin),
-):
-    """
-    Make a hidden review visible again.
-
-    MODERATOR + ADMIN: Restore visibility of a previously hidden review.
-    Supports both POST and PATCH methods.
-    """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found.",
-        )
-
-    review = reviews_service.show_review(db, review)
-    return review
 
+for _name, _action, _guard, _doc in _REVIEW_ACTIONS:
+    router.add_api_route(
+        f"/reviews/{{review_id}}/{_name}",
+        _make_review_action(_name, _action, _guard, _doc),
+        name=f"{_name}_review",
+        methods=["POST", "PATCH"],
+        response_model=schemas.ReviewRead,
+    )
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
-from services.reviews.app.dependencies import CurrentUser, get_db, get_current_user
+from services.reviews.app.dependencies import CurrentUser, get_analytics_db, get_current_user
 from services.reviews.app.service_layer import reviews_service
 from common.rbac import (
     ROLE_ADMIN,
@@ -17,6 +17,11 @@ from common.rbac import (
 )
 
 
+_ANALYTICS_ROLES = frozenset(
+    {ROLE_ADMIN, ROLE_MODERATOR, ROLE_FACILITY_MANAGER, ROLE_AUDITOR}
+)
+
+
 class AverageRatingItem(BaseModel):
     room_id: int
     avg_rating: float
@@ -31,16 +36,13 @@ router = APIRouter(prefix="/analytics", tags=["analytics"])
     response_model=list[AverageRatingItem],
 )
 def average_rating_by_room(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_analytics_db),
     current_user: CurrentUser = Depends(get_current_user),
 ):
     """
     Return average rating and review count grouped by room.
     """
-    if not has_role(
-        current_user.role,
-        [ROLE_ADMIN, ROLE_MODERATOR, ROLE_FACILITY_MANAGER, ROLE_AUDITOR],
-    ):
+    if not has_role(current_user.role, _ANALYTICS_ROLES):
         from common.exceptions import ForbiddenError
         raise ForbiddenError("Insufficient permissions for analytics.")
     return reviews_service.get_average_rating_by_room(db)
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 
 from .. import schemas
@@ -40,15 +40,7 @@ def flag_review(
 
     This is intended for handling inappropriate or suspicious content.
     """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found.",
-        )
-
-    review = reviews_service.flag_review(db, review)
-    return review
+    return reviews_service.flag_review(db, review_id)
 
 
 @router.post(
@@ -63,15 +55,7 @@ def unflag_review(
     """
     Clear the flagged state from a review.
     """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found.",
-        )
-
-    review = reviews_service.unflag_review(db, review)
-    return review
+    return reviews_service.unflag_review(db, review_id)
 
 
 @router.get(
@@ -89,4 +73,4 @@ def list_flagged_reviews(
     This is the "reports" view for moderators.
     """
     reviews = reviews_service.list_flagged_reviews(db)
-    return reviews
+    return Response(content=schemas.dump_review_list(reviews), media_type="application/json")
@@ -7,22 +7,26 @@ This router is mounted under the ``/reviews`` prefix in
 
 from __future__ import annotations
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from db.schema import Review
+
 from .. import schemas
 from ..dependencies import (
     CurrentUser,
     get_db,
+    get_review_or_404,
     require_authenticated,
     require_read_access,
     allow_owner_or_admin_or_moderator,
     rate_limit_by_user,
 )
 from common.rbac import ROLE_AUDITOR
-from common.exceptions import ForbiddenError, NotFoundError, BadRequestError
+from common.exceptions import ForbiddenError, BadRequestError
 from ..service_layer import reviews_service
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
@@ -59,18 +63,41 @@ def create_review(
     "/room/{room_id}",
     response_model=List[schemas.ReviewRead],
 )
-def get_reviews_for_room(
-    room_id: int,
-    db: Session = Depends(get_db),
-    _: CurrentUser = Depends(require_read_access),
-):
+def get_reviews_for_room(
+    room_id: int,
+    after_created_at: Optional[datetime] = Query(
+        default=None,
+        description="``created_at`` of the last review on the previous page.",
+    ),
+    after_id: Optional[int] = Query(
+        default=None,
+        description="``id`` of the last review on the previous page.",
+    ),
+    limit: int = Query(default=50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    _: CurrentUser = Depends(require_read_access),
+):
     """
-    Return all reviews associated with the given room.
+    Return reviews associated with the given room, oldest first.
 
-    Any authenticated user may access this endpoint.
+    Any authenticated user may access this endpoint. Results are paged;
+    pass the ``created_at`` and ``id`` of the last review received to
+    fetch the next page. Passing only one of the two is rejected, since the
+    cursor would otherwise be ignored and the first page returned again.
     """
-    reviews = reviews_service.list_reviews_for_room(db, room_id)
-    return reviews
+    if (after_created_at is None) != (after_id is None):
+        raise BadRequestError(
+            "after_created_at and after_id must be given together.",
+            error_code="INVALID_CURSOR",
+        )
+    reviews = reviews_service.list_reviews_for_room(
+        db,
+        room_id,
+        after_created_at=after_created_at,
+        after_id=after_id,
+        limit=limit,
+    )
+    return Response(content=schemas.dump_review_list(reviews), media_type="application/json")
 
 
 @router.put(
@@ -78,10 +105,10 @@ def get_reviews_for_room(
     response_model=schemas.ReviewRead,
 )
 def update_review(
-    review_id: int,
     payload: schemas.ReviewUpdate,
-    db: Session = Depends(get_db),
     current_user: CurrentUser = Depends(require_authenticated),
+    review: Review = Depends(get_review_or_404),
+    db: Session = Depends(get_db),
 ):
     """
     Update an existing review.
@@ -89,10 +116,6 @@ def update_review(
     Only the owner of the review (or later an admin, if extended) is
     allowed to modify it.
     """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise NotFoundError("Review not found.", error_code="REVIEW_NOT_FOUND")
-
     allow_owner_or_admin_or_moderator(review.user_id, current_user)
 
     review = reviews_service.update_review(db, review=review, payload=payload)
@@ -104,22 +127,16 @@ def update_review(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 def delete_review(
-    review_id: int,
-    db: Session = Depends(get_db),
     current_user: CurrentUser = Depends(require_authenticated),
+    review: Review = Depends(get_review_or_404),
+    db: Session = Depends(get_db),
 ):
     """
     Delete an existing review.
 
     Only the owner of the review is allowed to delete it.
     """
-    review = reviews_service.get_review(db, review_id)
-    if review is None:
-        raise NotFoundError("Review not found.", error_code="REVIEW_NOT_FOUND")
-
     allow_owner_or_admin_or_moderator(review.user_id, current_user)
 
-    from ..repository import reviews_repository
-
-    reviews_repository.delete_review(db, review)
+    reviews_service.delete_review(db, review)
     return None
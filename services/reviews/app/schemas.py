@@ -9,9 +9,9 @@ defined in :mod:`db.schema`.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class ReviewBase(BaseModel):
@@ -76,12 +76,19 @@ class ReviewRead(BaseModel):
     is_visible: bool
     created_at: Optional[datetime] = None
 
-    class Config:
-        """
-        Pydantic configuration.
+    # ``from_attributes`` allows automatic construction of this model from
+    # ORM objects returned by SQLAlchemy.
+    model_config = ConfigDict(from_attributes=True)
 
-        ``from_attributes`` allows automatic construction of this model
-        from ORM objects returned by SQLAlchemy.
-        """
 
-        from_attributes = True
+# One compiled validator/serializer for whole pages of reviews. List endpoints
+# run their rows through it in a single pydantic-core pass and return the JSON
+# bytes, instead of FastAPI validating and encoding each row separately.
+REVIEW_READ_LIST = TypeAdapter(List[ReviewRead])
+
+
+def dump_review_list(rows) -> bytes:
+    """
+    Validate ``rows`` (dicts or ORM objects) as ``ReviewRead`` and encode them.
+    """
+    return REVIEW_READ_LIST.dump_json(REVIEW_READ_LIST.validate_python(rows))
@@ -13,6 +13,9 @@ repository functions. It knows how to:
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
@@ -23,12 +26,76 @@ from ..clients import users_client, rooms_client, bookings_client
 from db.schema import Review
 from common.config import get_settings
 from common.exceptions import BadRequestError, NotFoundError, ForbiddenError
+from common.threadpool import db_worker_threads
+from common.ttl_cache import TTLCache
 
 
-_HTML_TAG_RE = re.compile(r"<[^>]+>")
+settings = get_settings()
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
 _PROFANITY = {"spamword", "offensive"}  # simple placeholder list
+# All terms in one case-insensitive alternation: a single scan of the
+# comment instead of lowercasing it and searching once per term.
+_PROFANITY_RE = re.compile(
+    "|".join(re.escape(term) for term in sorted(_PROFANITY, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+# The per-room rating aggregate is read far more often than reviews change.
+# Writes that affect it clear the cache; the TTL bounds staleness across
+# worker processes. The query runs outside the cache lock so writers never
+# wait on it, and a result computed before a write's invalidation is dropped.
+RATING_CACHE_TTL_SECONDS = 30.0
+_rating_cache: TTLCache[str, List[dict]] = TTLCache(RATING_CACHE_TTL_SECONDS, maxsize=1)
+
+# Runs the Bookings check of ``create_review`` while the request thread asks
+# Rooms. Sized like the request threadpool, so every in-flight create gets a
+# worker instead of queueing behind a smaller pool.
+_validation_pool = ThreadPoolExecutor(
+    max_workers=db_worker_threads(), thread_name_prefix="review-validate"
+)
+
+
+def _invalidate_rating_cache() -> None:
+    """
+    Drop the cached rating aggregate so the next read recomputes it.
+    """
+    _rating_cache.clear()
+
 
+def _strip_tags(text: str) -> str:
+    """
+    Remove ``<...>`` tags (at least one character between the brackets).
 
+    Scans with ``str.find`` rather than a ``<[^>]+>`` regex, which rescans
+    to the end of the text for every unterminated ``<`` and so goes
+    quadratic on input such as ``"<" * 10_000``.
+    """
+    parts = []
+    start = 0
+    search_from = 0
+    while True:
+        lt = text.find("<", search_from)
+        if lt == -1:
+            break
+        gt = text.find(">", lt + 1)
+        if gt == -1:
+            # No later '<' can close either.
+            break
+        if gt == lt + 1:
+            # "<>" is not a tag; keep it and look past this '<'.
+            search_from = lt + 1
+            continue
+        parts.append(text[start:lt])
+        start = search_from = gt + 1
+    parts.append(text[start:])
+    return "".join(parts)
+
+
+# Both checks are pure functions of the comment text, and short comments
+# ("great", "ok") repeat a lot, so their results are memoized.
+@lru_cache(maxsize=4096)
 def _sanitize_comment(comment: str) -> str:
     """
     Sanitize a review comment.
@@ -36,21 +103,18 @@ def _sanitize_comment(comment: str) -> str:
     Steps applied:
 
     * Strip leading/trailing whitespace.
-    * Remove simple HTML tags using a regular expression.
+    * Remove simple HTML tags (see :func:`_strip_tags`).
     * Collapse consecutive whitespace characters into a single space.
 
     Returns a safe, normalized string. If the result is empty, the
     caller may decide to reject the comment.
     """
-    text = comment.strip()
-    text = _HTML_TAG_RE.sub("", text)
-    text = re.sub(r"\s+", " ", text)
-    return text
+    return _WHITESPACE_RE.sub(" ", _strip_tags(comment.strip()))
 
 
+@lru_cache(maxsize=4096)
 def _contains_profanity(comment: str) -> bool:
-    lowered = comment.lower()
-    return any(token in lowered for token in _PROFANITY)
+    return _PROFANITY_RE.search(comment) is not None
 
 
 def create_review(
@@ -83,17 +147,26 @@ def create_review(
     BadRequestError
         If the comment is empty after sanitization or contains profanity.
     """
-    settings = get_settings()
     if not users_client.ensure_user_exists(author_user_id):
         raise NotFoundError("User does not exist.", error_code="USER_NOT_FOUND")
 
-    if not rooms_client.ensure_room_is_active(payload.room_id):
+    # Optional business rule: user must have at least one booking. Once the
+    # author is known, the Rooms and Bookings checks run side by side.
+    booking_check = (
+        _validation_pool.submit(
+            bookings_client.user_has_booking_for_room, author_user_id, payload.room_id
+        )
+        if settings.require_booking_for_review
+        else None
+    )
+    room_active = rooms_client.ensure_room_is_active(payload.room_id)
+
+    # Results are checked in the original order so the reported error does
+    # not depend on which lookup finished first.
+    if not room_active:
         raise NotFoundError("Room is not active or does not exist.", error_code="ROOM_NOT_FOUND")
 
-    # Optional business rule: user must have at least one booking
-    if settings.require_booking_for_review and not bookings_client.user_has_booking_for_room(
-        author_user_id, payload.room_id
-    ):
+    if booking_check is not None and not booking_check.result():
         raise ForbiddenError("A booking is required to review this room.", error_code="BOOKING_REQUIRED_FOR_REVIEW")
 
     comment = _sanitize_comment(payload.comment)
@@ -109,6 +182,7 @@ def create_review(
         rating=payload.rating,
         comment=comment,
     )
+    _invalidate_rating_cache()
     return review
 
 
@@ -143,7 +217,9 @@ def update_review(
             raise BadRequestError("Comment cannot be empty after sanitization.", error_code="INVALID_COMMENT")
         review.comment = sanitized
 
-    review = reviews_repository.save_review(db, review)
+    review = reviews_repository.save_review(db, review, refresh=False)
+    if payload.rating is not None:
+        _invalidate_rating_cache()
     return review
 
 
@@ -154,69 +230,104 @@ def get_review(db: Session, review_id: int) -> Optional[Review]:
     return reviews_repository.get_review_by_id(db, review_id)
 
 
-def list_reviews_for_room(db: Session, room_id: int) -> List[Review]:
+def list_reviews_for_room(
+    db: Session,
+    room_id: int,
+    *,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+    limit: int = 50,
+) -> List[dict]:
     """
-    Return all reviews for a given room.
+    Return a page of reviews for a given room.
     """
-    return reviews_repository.list_reviews_for_room(db, room_id)
+    return reviews_repository.list_reviews_for_room(
+        db,
+        room_id,
+        after_created_at=after_created_at,
+        after_id=after_id,
+        limit=limit,
+    )
 
 
-def list_flagged_reviews(db: Session) -> List[Review]:
+def list_flagged_reviews(db: Session) -> List[dict]:
     """
     Return all reviews currently marked as flagged.
     """
     return reviews_repository.list_flagged_reviews(db)
 
 
-def list_all_reviews(db: Session) -> List[Review]:
+def list_all_reviews(db: Session) -> List[dict]:
     """
     Return all reviews in the system.
     """
     return reviews_repository.list_all_reviews(db)
 
 
+def delete_review(db: Session, review: Review) -> None:
+    """
+    Permanently delete the given review.
+    """
+    reviews_repository.delete_review(db, review)
+    _invalidate_rating_cache()
+
+
 def get_average_rating_by_room(db: Session) -> List[dict]:
     """
     Return average rating and count grouped by room.
+
+    Results are cached for up to :data:`RATING_CACHE_TTL_SECONDS`.
+    """
+    cached = _rating_cache.get("avg_by_room")
+    if cached is not None:
+        return cached
+    generation = _rating_cache.generation
+    rows = reviews_repository.get_average_rating_by_room(db)
+    return _rating_cache.set("avg_by_room", rows, generation=generation)
+
+
+def _set_flags(db: Session, review_id: int, **flags: bool) -> dict:
+    """
+    Apply moderation flags to a review and return it, or raise 404.
     """
-    return reviews_repository.get_average_rating_by_room(db)
+    review = reviews_repository.set_review_flags(db, review_id, **flags)
+    if review is None:
+        raise NotFoundError("Review not found.", error_code="REVIEW_NOT_FOUND")
+    return review
 
 
-def flag_review(db: Session, review: Review) -> Review:
+def flag_review(db: Session, review_id: int) -> dict:
     """
     Mark the given review as flagged.
     """
-    review.is_flagged = True
-    return reviews_repository.save_review(db, review)
+    return _set_flags(db, review_id, is_flagged=True)
 
 
-def unflag_review(db: Session, review: Review) -> Review:
+def unflag_review(db: Session, review_id: int) -> dict:
     """
     Clear the flagged state of the given review.
     """
-    review.is_flagged = False
-    return reviews_repository.save_review(db, review)
+    return _set_flags(db, review_id, is_flagged=False)
 
 
-def hide_review(db: Session, review: Review) -> Review:
+def hide_review(db: Session, review_id: int) -> dict:
     """
     Hide the given review from public view.
     """
-    review.is_visible = False
-    return reviews_repository.save_review(db, review)
+    return _set_flags(db, review_id, is_visible=False)
 
 
-def show_review(db: Session, review: Review) -> Review:
+def show_review(db: Session, review_id: int) -> dict:
     """
     Make the given review visible to the public.
     """
-    review.is_visible = True
-    return reviews_repository.save_review(db, review)
+    return _set_flags(db, review_id, is_visible=True)
 
 
 __all__ = [
     "create_review",
     "update_review",
+    "delete_review",
     "get_review",
     "list_reviews_for_room",
     "list_flagged_reviews",
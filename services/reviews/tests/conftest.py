@@ -56,10 +56,13 @@ def reset_database() -> Generator[None, None, None]:
     yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
     """
     Provide a FastAPI test client bound to the Reviews app.
+
+    One client (and one app lifespan) serves the whole run; tests only share
+    it, they never change its state.
     """
     with TestClient(app) as test_client:
         yield test_client
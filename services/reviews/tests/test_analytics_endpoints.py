@@ -1,9 +1,11 @@
 from pathlib import Path
 import sys
 
+import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 ROOT_DIR = Path(__file__).resolve().parents[3]
 if str(ROOT_DIR) not in sys.path:
@@ -12,13 +14,17 @@ if str(ROOT_DIR) not in sys.path:
 from db.schema import Base, Review  # noqa: E402
 from services.reviews.app.main import app  # noqa: E402
 from services.reviews.app import dependencies  # noqa: E402
+from services.reviews.app.service_layer import reviews_service  # noqa: E402
 from common.auth import create_access_token  # noqa: E402
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test_reviews_analytics.db"
+# In-memory database; StaticPool keeps the single connection (and with it the
+# schema and sample rows) alive across sessions.
+SQLALCHEMY_DATABASE_URL = "sqlite://"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(
     autocommit=False,
@@ -36,6 +42,7 @@ def _override_get_db():
 
 
 app.dependency_overrides[dependencies.get_db] = _override_get_db
+app.dependency_overrides[dependencies.get_analytics_db] = _override_get_db
 
 
 def _make_token(user_id: int, role: str, username: str | None = None) -> str:
@@ -53,19 +60,22 @@ def setup_module(module) -> None:
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     with TestingSessionLocal() as db:
-        samples = [
-            Review(user_id=1, room_id=1, rating=5, comment="great", is_flagged=False),
-            Review(user_id=2, room_id=1, rating=4, comment="good", is_flagged=False),
-            Review(user_id=3, room_id=2, rating=3, comment="ok", is_flagged=False),
-            Review(user_id=4, room_id=2, rating=3, comment="meh", is_flagged=False),
-            Review(user_id=5, room_id=2, rating=4, comment="nice", is_flagged=False),
-        ]
-        db.add_all(samples)
+        db.execute(
+            insert(Review),
+            [
+                dict(user_id=1, room_id=1, rating=5, comment="great", is_flagged=False),
+                dict(user_id=2, room_id=1, rating=4, comment="good", is_flagged=False),
+                dict(user_id=3, room_id=2, rating=3, comment="ok", is_flagged=False),
+                dict(user_id=4, room_id=2, rating=3, comment="meh", is_flagged=False),
+                dict(user_id=5, room_id=2, rating=4, comment="nice", is_flagged=False),
+            ],
+        )
         db.commit()
+    # The samples bypass the service, so drop any aggregate it cached earlier.
+    reviews_service._invalidate_rating_cache()
 
 
-def test_average_rating_requires_privileged_role() -> None:
-    client = TestClient(app)
+def test_average_rating_requires_privileged_role(client: TestClient) -> None:
     token = _make_token(10, "regular")
     resp = client.get(
         "/api/v1/analytics/reviews/average-rating-by-room",
@@ -74,8 +84,7 @@ def test_average_rating_requires_privileged_role() -> None:
     assert resp.status_code in (401, 403)
 
 
-def test_average_rating_by_room_admin() -> None:
-    client = TestClient(app)
+def test_average_rating_by_room_admin(client: TestClient) -> None:
     token = _make_token(1, "admin")
     resp = client.get(
         "/api/v1/analytics/reviews/average-rating-by-room",
@@ -93,3 +102,27 @@ def test_average_rating_by_room_admin() -> None:
     assert data[1]["review_count"] == 2
     assert round(data[2]["avg_rating"], 2) == 3.33
     assert data[2]["review_count"] == 3
+
+
+def test_average_rating_racing_a_write_is_not_cached(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    original = reviews_service.reviews_repository.get_average_rating_by_room
+
+    def query_then_invalidate(db):
+        rows = original(db)
+        # A review write commits and invalidates while the aggregate runs.
+        reviews_service._invalidate_rating_cache()
+        return rows
+
+    monkeypatch.setattr(
+        reviews_service.reviews_repository, "get_average_rating_by_room", query_then_invalidate
+    )
+    reviews_service._invalidate_rating_cache()
+    token = _make_token(1, "admin")
+    resp = client.get(
+        "/api/v1/analytics/reviews/average-rating-by-room",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 200
+    assert reviews_service._rating_cache.get("avg_by_room") is None
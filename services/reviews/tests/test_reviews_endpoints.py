@@ -11,9 +11,11 @@ These tests verify:
 
 from __future__ import annotations
 
+import pytest
 from fastapi.testclient import TestClient
 
 from common.auth import create_access_token
+from services.reviews.app.service_layer import reviews_service
 
 
 def _make_token(user_id: int, role: str, username: str | None = None) -> str:
@@ -56,6 +58,52 @@ def test_valid_review_is_accepted(client: TestClient) -> None:
     assert data["is_flagged"] is False
 
 
+def test_create_validation_errors_follow_user_room_booking_order(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    An unknown author is reported before any Rooms or Bookings call, and a
+    failing room check wins over a failing booking check.
+    """
+    calls = []
+    user_exists = {"value": False}
+
+    def fake_user(user_id):
+        calls.append("user")
+        return user_exists["value"]
+
+    def fake_room(room_id):
+        calls.append("room")
+        return False
+
+    def fake_booking(user_id, room_id):
+        calls.append("booking")
+        return False
+
+    monkeypatch.setattr(reviews_service.users_client, "ensure_user_exists", fake_user)
+    monkeypatch.setattr(reviews_service.rooms_client, "ensure_room_is_active", fake_room)
+    monkeypatch.setattr(reviews_service.bookings_client, "user_has_booking_for_room", fake_booking)
+    monkeypatch.setattr(reviews_service.settings, "require_booking_for_review", True)
+
+    token = _make_token(user_id=60, role="regular")
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {"room_id": 1, "rating": 4, "comment": "Fine"}
+
+    response = client.post("/api/v1/reviews", json=payload, headers=headers)
+    assert response.status_code == 404
+    assert response.json()["error_code"] == "USER_NOT_FOUND"
+    assert calls == ["user"]
+
+    user_exists["value"] = True
+    calls.clear()
+    response = client.post("/api/v1/reviews", json=payload, headers=headers)
+    assert response.status_code == 404
+    assert response.json()["error_code"] == "ROOM_NOT_FOUND"
+    # The booking lookup may still be running in the pool; only its
+    # failure must not be the one reported.
+    assert calls[:1] == ["user"] and "room" in calls
+
+
 def test_invalid_rating_is_rejected(client: TestClient) -> None:
     """
     A rating outside the range [1, 5] should be rejected by validation.
@@ -101,6 +149,19 @@ def test_unauthenticated_cannot_create_update_delete(client: TestClient) -> None
     assert delete_resp.status_code in (401, 403)
 
 
+def test_auth_is_checked_before_missing_review_lookup(client: TestClient) -> None:
+    """
+    Unknown review ids must not be revealed to callers who fail auth.
+    """
+    assert client.put("/api/v1/reviews/999999", json={"rating": 3}).status_code == 401
+    assert client.delete("/api/v1/reviews/999999").status_code == 401
+    assert client.delete("/api/v1/admin/reviews/999999").status_code == 401
+
+    token = _make_token(user_id=51, role="regular", username="notadmin")
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.delete("/api/v1/admin/reviews/999999", headers=headers).status_code == 403
+
+
 def test_only_owner_can_update_and_delete(client: TestClient) -> None:
     """
     Only the owner of a review should be allowed to update or delete it.
@@ -263,3 +324,54 @@ def test_flagged_reviews_listing_requires_moderator(client: TestClient) -> None:
     assert allowed.status_code == 200
     payload = allowed.json()
     assert any(item["id"] == review_id for item in payload)
+
+
+def test_room_reviews_are_paged_by_keyset(client: TestClient) -> None:
+    """
+    ``after_created_at``/``after_id`` should continue where the last page ended.
+    """
+    token = _make_token(user_id=40, role="regular", username="pager")
+    headers = {"Authorization": f"Bearer {token}"}
+    room_id = 77
+    for rating in (3, 4, 5):
+        resp = client.post(
+            "/api/v1/reviews",
+            json={"room_id": room_id, "rating": rating, "comment": f"Visit {rating}"},
+            headers=headers,
+        )
+        assert resp.status_code in (200, 201)
+
+    first_page = client.get(f"/api/v1/reviews/room/{room_id}?limit=2", headers=headers).json()
+    assert len(first_page) == 2
+    last = first_page[-1]
+    second_page = client.get(
+        f"/api/v1/reviews/room/{room_id}",
+        params={"limit": 2, "after_created_at": last["created_at"], "after_id": last["id"]},
+        headers=headers,
+    ).json()
+    assert [r["rating"] for r in first_page + second_page] == [3, 4, 5]
+
+
+def test_half_keyset_cursor_is_rejected(client: TestClient) -> None:
+    """
+    Passing only one of ``after_created_at``/``after_id`` should be a 400,
+    not a silent restart from the first page.
+    """
+    token = _make_token(user_id=41, role="regular", username="halfcursor")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for params in ({"after_id": 1}, {"after_created_at": "2024-01-01T00:00:00"}):
+        response = client.get("/api/v1/reviews/room/77", params=params, headers=headers)
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "INVALID_CURSOR"
+
+
+def test_moderation_on_missing_review_returns_404(client: TestClient) -> None:
+    """
+    Routes taking a ``review_id`` should answer 404 for unknown reviews.
+    """
+    token = _make_token(user_id=50, role="moderator", username="mod404")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.post("/api/v1/reviews/999999/flag", headers=headers).status_code == 404
+    assert client.put("/api/v1/reviews/999999", json={"rating": 2}, headers=headers).status_code == 404
@@ -5,6 +5,8 @@ Client utilities for interacting with the Bookings service from Rooms.
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List
 
 import httpx
 
@@ -14,6 +16,18 @@ from common.logging_utils import get_logger
 from common.service_account import get_service_account_token
 
 _logger = get_logger(__name__)
+settings = get_settings()
+
+
+@lru_cache(maxsize=4)
+def _client(base_url: str, timeout: float) -> ServiceHTTPClient:
+    """
+    Return the shared Bookings client for ``base_url``.
+
+    The service-account token is sent with each request instead, since it
+    is refreshed more often than the client is rebuilt.
+    """
+    return ServiceHTTPClient(base_url, timeout=timeout, service_name="bookings")
 
 
 def is_room_currently_booked(room_id: int, *, start_time: datetime | None = None, end_time: datetime | None = None) -> bool:
@@ -23,19 +37,12 @@ def is_room_currently_booked(room_id: int, *, start_time: datetime | None = None
     Falls back to ``False`` on downstream failures when ``client_stub_fallback``
     is enabled in settings.
     """
-    settings = get_settings()
     if start_time is None:
         start_time = datetime.utcnow()
     if end_time is None:
         end_time = start_time + timedelta(minutes=5)
 
-    token = get_service_account_token()
-    client = ServiceHTTPClient(
-        settings.bookings_service_url,
-        timeout=settings.http_client_timeout,
-        default_headers={"Authorization": f"Bearer {token}"},
-        service_name="bookings",
-    )
+    client = _client(settings.bookings_service_url, settings.http_client_timeout)
     try:
         resp = client.get(
             "/api/v1/bookings/check-availability",
@@ -44,6 +51,7 @@ def is_room_currently_booked(room_id: int, *, start_time: datetime | None = None
                 "start_time": start_time.isoformat(),
                 "end_time": end_time.isoformat(),
             },
+            headers={"Authorization": f"Bearer {get_service_account_token()}"},
         )
         resp.raise_for_status()
         data = resp.json()
@@ -53,3 +61,42 @@ def is_room_currently_booked(room_id: int, *, start_time: datetime | None = None
             _logger.warning("Falling back to stub availability for room %s: %s", room_id, exc)
             return False
         raise
+
+
+def are_rooms_currently_booked(
+    room_ids: List[int],
+    *,
+    start_time: datetime | None = None,
+    end_time: datetime | None = None,
+) -> Dict[int, bool]:
+    """
+    Batch form of :func:`is_room_currently_booked`: one Bookings call for all rooms.
+
+    Every room maps to ``False`` on downstream failures when
+    ``client_stub_fallback`` is enabled in settings.
+    """
+    if not room_ids:
+        return {}
+    if start_time is None:
+        start_time = datetime.utcnow()
+    if end_time is None:
+        end_time = start_time + timedelta(minutes=5)
+
+    client = _client(settings.bookings_service_url, settings.http_client_timeout)
+    try:
+        resp = client.get(
+            "/api/v1/bookings/check-availability/batch",
+            params={
+                "room_ids": room_ids,
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+            },
+            headers={"Authorization": f"Bearer {get_service_account_token()}"},
+        )
+        resp.raise_for_status()
+        return {item["room_id"]: not item.get("available", False) for item in resp.json()}
+    except httpx.HTTPError as exc:
+        if settings.client_stub_fallback:
+            _logger.warning("Falling back to stub availability for rooms %s: %s", room_ids, exc)
+            return {room_id: False for room_id in room_ids}
+        raise
@@ -4,23 +4,24 @@ Shared dependencies for the Rooms service.
 This module defines:
 
 * A database session provider ``get_db``.
-* A ``CurrentUser`` model populated from JWT tokens.
+* A ``CurrentUser`` dataclass populated from JWT tokens.
 * Helper dependency ``require_room_manager`` that ensures the caller
   has either the ``admin`` or ``facility_manager`` role.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Generator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from pydantic import BaseModel
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from common.auth import verify_access_token
+from common.auth import get_jwt_validator
 from common.config import get_settings
+from common.db import engine_pool_options
 from common.rbac import ROLE_ADMIN, ROLE_FACILITY_MANAGER, has_role
 from common.exceptions import UnauthorizedError, ForbiddenError
 
@@ -30,8 +31,10 @@ from common.exceptions import UnauthorizedError, ForbiddenError
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, future=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(settings.database_url, future=True, **engine_pool_options(settings.database_url))
+# Rooms are returned and serialized straight after commit; keeping their
+# loaded state avoids a reload SELECT per write.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -50,11 +53,16 @@ def get_db() -> Generator[Session, None, None]:
 # ---------------------------------------------------------------------------
 
 security_scheme = HTTPBearer(auto_error=True)
+_jwt_validator = get_jwt_validator()
 
 
-class CurrentUser(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CurrentUser:
     """
     Minimal representation of the authenticated user used by this service.
+
+    Only ever built from claims of a verified token, which
+    :func:`get_current_user` casts itself, so no model validation is needed.
     """
 
     id: int
@@ -63,20 +71,29 @@ class CurrentUser(BaseModel):
 
 
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
 ) -> CurrentUser:
     """
     Decode the JWT token and return the current user.
 
+    The result is kept on ``request.state.current_user`` so anything else
+    handling the same request (handlers, sub-dependencies declared with
+    ``use_cache=False``) reuses it instead of verifying the token again.
+
     Raises
     ------
     HTTPException
         If the token is invalid or missing required claims.
     """
+    cached = getattr(request.state, "current_user", None)
+    if cached is not None:
+        return cached
+
     token = credentials.credentials
 
-    try:
-        payload = verify_access_token(token)
+    try:
+        payload = _jwt_validator.decode(token)
     except Exception:  # noqa: BLE001
         raise UnauthorizedError("Invalid authentication token.")
 
@@ -89,7 +106,9 @@ def get_current_user(
     if user_id is None or role is None:
         raise UnauthorizedError("Token missing required claims.")
 
-    return CurrentUser(id=int(user_id), username=str(username), role=str(role))
+    user = CurrentUser(id=int(user_id), username=str(username), role=str(role))
+    request.state.current_user = user
+    return user
 
 
 def require_room_manager(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
@@ -14,15 +14,25 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
 from common.exceptions import AppError
+from common.threadpool import size_threadpool_to_db_pool
 from .routers import rooms_routes
 
 logger = logging.getLogger(__name__)
 
+
 app = FastAPI(
     title="Smart Meeting Room - Rooms Service",
     version="0.1.0",
+    lifespan=size_threadpool_to_db_pool,
 )
 
+# Error codes for HTTPException statuses; anything else maps to HTTP_ERROR.
+_HTTP_ERROR_CODES = {
+    status.HTTP_401_UNAUTHORIZED: "UNAUTHORIZED",
+    status.HTTP_403_FORBIDDEN: "FORBIDDEN",
+    status.HTTP_404_NOT_FOUND: "NOT_FOUND",
+}
+
 
 # Exception handlers
 @app.exception_handler(AppError)
@@ -68,13 +78,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     - 404 → NOT_FOUND
     - others → HTTP_ERROR
     """
-    error_code_map = {
-        status.HTTP_401_UNAUTHORIZED: "UNAUTHORIZED",
-        status.HTTP_403_FORBIDDEN: "FORBIDDEN",
-        status.HTTP_404_NOT_FOUND: "NOT_FOUND",
-    }
-
-    error_code = error_code_map.get(exc.status_code, "HTTP_ERROR")
+    error_code = _HTTP_ERROR_CODES.get(exc.status_code, "HTTP_ERROR")
     message = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
 
     return JSONResponse(
@@ -8,13 +8,25 @@ logic and HTTP concerns.
 
 from __future__ import annotations
 
-from typing import List, Optional
-from sqlalchemy import func, and_
+from typing import List, Optional
+from sqlalchemy import func, and_, select
 
 from sqlalchemy.orm import Session
 
 from db.schema import Room
 
+# Columns exposed by ``schemas.RoomRead``. Listings select just these and
+# return plain dicts, so read-only rows never enter the identity map.
+_ROOM_READ_COLUMNS = (
+    Room.id,
+    Room.name,
+    Room.location,
+    Room.capacity,
+    Room.equipment,
+    Room.status,
+    Room.created_at,
+)
+
 
 def get_room_by_id(db: Session, room_id: int) -> Optional[Room]:
     """
@@ -23,6 +35,15 @@ def get_room_by_id(db: Session, room_id: int) -> Optional[Room]:
     return db.query(Room).filter(Room.id == room_id).first()
 
 
+def get_rooms_by_ids(db: Session, room_ids: List[int]) -> List[Room]:
+    """
+    Retrieve the rooms with the given ids in one query, ordered by id.
+
+    Ids with no matching room are skipped.
+    """
+    return db.query(Room).filter(Room.id.in_(room_ids)).order_by(Room.id.asc()).all()
+
+
 def get_room_by_name(db: Session, name: str) -> Optional[Room]:
     """
     Retrieve a room by its unique name (case-insensitive).
@@ -42,10 +63,10 @@ def list_rooms(
     equipment: Optional[str] = None,
     equipment_list: Optional[List[str]] = None,
     offset: int = 0,
-    limit: Optional[int] = None,
-) -> List[Room]:
+    limit: int = 50,
+) -> List[dict]:
     """
-    Return rooms matching the provided filters.
+    Return rooms matching the provided filters, as ``RoomRead``-shaped dicts.
 
     Parameters
     ----------
@@ -60,30 +81,30 @@ def list_rooms(
     equipment:
         If provided, only rooms whose ``equipment`` text contains this
         token are returned (case-insensitive ``LIKE`` filter).
+    offset, limit:
+        Page window, always applied in SQL; the router caps ``limit``.
     """
-    query = db.query(Room)
+    stmt = select(*_ROOM_READ_COLUMNS)
 
     if min_capacity is not None:
-        query = query.filter(Room.capacity >= min_capacity)
+        stmt = stmt.where(Room.capacity >= min_capacity)
 
-    if location is not None:
-        query = query.filter(func.lower(Room.location) == func.lower(location))
+    if location is not None:
+        stmt = stmt.where(func.lower(Room.location) == func.lower(location))
 
+    # ``equipment`` and ``equipment_list`` are ANDed together, so fold them
+    # into one set of distinct tokens (ILIKE ignores case); a token repeated
+    # across or within the parameters is matched once, not once per mention.
+    tokens = {item.lower() for item in equipment_list or ()}
     if equipment is not None:
-        pattern = f"%{equipment}%"
-        query = query.filter(Room.equipment.ilike(pattern))
-
-    if equipment_list:
-        for item in equipment_list:
-            pattern = f"%{item}%"
-            query = query.filter(Room.equipment.ilike(pattern))
+        tokens.add(equipment.lower())
+    if tokens:
+        stmt = stmt.where(
+            and_(*(Room.equipment.ilike(f"%{token}%") for token in sorted(tokens)))
+        )
 
-    query = query.order_by(Room.id.asc())
-    if offset:
-        query = query.offset(offset)
-    if limit:
-        query = query.limit(limit)
-    return query.all()
+    stmt = stmt.order_by(Room.id.asc()).offset(offset).limit(limit)
+    return [dict(row) for row in db.execute(stmt).mappings()]
 
 
 def create_room(
@@ -107,7 +128,6 @@ def create_room(
     )
     db.add(room)
     db.commit()
-    db.refresh(room)
     return room
 
 
@@ -117,7 +137,6 @@ def save_room(db: Session, room: Room) -> Room:
     """
     db.add(room)
     db.commit()
-    db.refresh(room)
     return room
 
 
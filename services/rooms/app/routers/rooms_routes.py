@@ -10,7 +10,7 @@ from __future__ import annotations
 from typing import List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from .. import schemas
@@ -67,8 +67,13 @@ def list_rooms(
         default=None,
         description="Multiple equipment tokens that must all be present.",
     ),
-    offset: int = 0,
-    limit: Optional[int] = None,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(
+        default=50,
+        ge=1,
+        le=500,
+        description="Maximum number of rooms to return (at most 500).",
+    ),
     db: Session = Depends(get_db),
     _: CurrentUser = Depends(get_current_user),
 ):
@@ -84,7 +89,31 @@ def list_rooms(
         offset=offset,
         limit=limit,
     )
-    return rooms
+    return Response(content=schemas.ROOM_READ_LIST.dump_json(rooms), media_type="application/json")
+
+
+@router.get(
+    "/status",
+    response_model=List[schemas.RoomStatusResponse],
+)
+def get_rooms_status(
+    ids: List[int] = Query(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Room ids to report on; repeat the parameter for each room.",
+    ),
+    start_time: datetime | None = Query(None),
+    end_time: datetime | None = Query(None),
+    db: Session = Depends(get_db),
+    _: CurrentUser = Depends(get_current_user),
+):
+    """
+    Return the static and dynamic status of several rooms at once.
+
+    Rooms that do not exist are omitted from the response.
+    """
+    return rooms_service.get_rooms_status(db, ids, start_time=start_time, end_time=end_time)
 
 
 @router.get(
@@ -99,7 +128,7 @@ def get_room(
     """
     Retrieve a single room by its identifier.
     """
-    room = rooms_service.get_room(db, room_id)
+    room = rooms_service.get_room_read(db, room_id)
     if room is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -160,9 +189,7 @@ def delete_room(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Room not found.",
         )
-    from ..repository import rooms_repository
-
-    rooms_repository.delete_room(db, room)
+    rooms_service.delete_room(db, room)
     return None
 
 
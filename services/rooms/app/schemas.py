@@ -11,7 +11,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
 from typing import Literal
 
 
@@ -93,3 +93,8 @@ class RoomStatusResponse(BaseModel):
         default=False,
         description="Indicates whether the room is currently booked for the requested time window.",
     )
+
+
+# Validates and serializes whole room listings in one pydantic-core call;
+# ``GET /rooms`` returns its JSON bytes directly.
+ROOM_READ_LIST = TypeAdapter(List[RoomRead])
@@ -13,11 +13,30 @@ from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 
-from ..schemas import RoomCreate, RoomRead, RoomStatusResponse, RoomUpdate
+from ..schemas import ROOM_READ_LIST, RoomCreate, RoomRead, RoomStatusResponse, RoomUpdate
 from ..repository import rooms_repository
 from db.schema import Room
 from ..clients import bookings_client
 from common.exceptions import BadRequestError, NotFoundError
+from common.ttl_cache import TTLCache
+
+# Room metadata changes rarely, so the read endpoints serve serialized rooms
+# from memory for up to the TTL. Every room write in this process clears both
+# caches, and reads store only if no clear happened while they queried, so a
+# room loaded before a write is never cached after it. The TTL bounds
+# staleness seen by other worker processes.
+ROOM_CACHE_TTL_SECONDS = 30.0
+ROOM_CACHE_MAXSIZE = 1024
+_room_cache: TTLCache[int, RoomRead] = TTLCache(ROOM_CACHE_TTL_SECONDS, ROOM_CACHE_MAXSIZE)
+_room_list_cache: TTLCache[tuple, List[RoomRead]] = TTLCache(ROOM_CACHE_TTL_SECONDS, ROOM_CACHE_MAXSIZE)
+
+
+def _invalidate_room_cache() -> None:
+    """
+    Drop every cached room and room listing.
+    """
+    _room_cache.clear()
+    _room_list_cache.clear()
 
 
 def _equipment_list_to_csv(equipment: Optional[list[str]]) -> str:
@@ -63,6 +82,7 @@ def create_room(db: Session, payload: RoomCreate) -> Room:
     )
     # Normalize equipment list for the API response
     room.equipment = equipment_csv  # type: ignore[attr-defined]
+    _invalidate_room_cache()
     return room
 
 
@@ -97,6 +117,7 @@ def update_room(db: Session, room_id: int, payload: RoomUpdate) -> Optional[Room
         room.equipment = _equipment_list_to_csv(payload.equipment)
 
     room = rooms_repository.save_room(db, room)
+    _invalidate_room_cache()
     return room
 
 
@@ -107,6 +128,31 @@ def get_room(db: Session, room_id: int) -> Optional[Room]:
     return rooms_repository.get_room_by_id(db, room_id)
 
 
+def get_room_read(db: Session, room_id: int) -> Optional[RoomRead]:
+    """
+    Return the API representation of a room, or ``None`` if it does not exist.
+
+    Served from cache for up to :data:`ROOM_CACHE_TTL_SECONDS`. Missing rooms
+    are not cached.
+    """
+    cached = _room_cache.get(room_id)
+    if cached is not None:
+        return cached
+    generation = _room_cache.generation
+    room = rooms_repository.get_room_by_id(db, room_id)
+    if room is None:
+        return None
+    return _room_cache.set(room_id, RoomRead.model_validate(room), generation=generation)
+
+
+def delete_room(db: Session, room: Room) -> None:
+    """
+    Delete ``room`` and drop cached room data.
+    """
+    rooms_repository.delete_room(db, room)
+    _invalidate_room_cache()
+
+
 def list_rooms(
     db: Session,
     *,
@@ -115,12 +161,28 @@ def list_rooms(
     equipment: Optional[str] = None,
     equipment_list: Optional[list[str]] = None,
     offset: int = 0,
-    limit: Optional[int] = None,
-) -> List[Room]:
+    limit: int = 50,
+) -> List[RoomRead]:
     """
     Return rooms matching the given filters.
+
+    Each distinct filter combination is cached for up to
+    :data:`ROOM_CACHE_TTL_SECONDS`; the order of and repeats in
+    ``equipment_list`` do not change the result, so they share an entry.
     """
-    return rooms_repository.list_rooms(
+    key = (
+        min_capacity,
+        location,
+        equipment,
+        tuple(sorted(set(equipment_list))) if equipment_list else None,
+        offset,
+        limit,
+    )
+    cached = _room_list_cache.get(key)
+    if cached is not None:
+        return list(cached)
+    generation = _room_list_cache.generation
+    rooms = rooms_repository.list_rooms(
         db,
         min_capacity=min_capacity,
         location=location,
@@ -129,6 +191,8 @@ def list_rooms(
         offset=offset,
         limit=limit,
     )
+    reads = ROOM_READ_LIST.validate_python(rooms)
+    return list(_room_list_cache.set(key, reads, generation=generation))
 
 
 def get_room_status(db: Session, room_id: int, start_time: datetime | None = None, end_time: datetime | None = None) -> Optional[RoomStatusResponse]:
@@ -158,3 +222,39 @@ def get_room_status(db: Session, room_id: int, start_time: datetime | None = Non
         static_status=room.status,
         is_currently_booked=is_booked,
     )
+
+
+def get_rooms_status(
+    db: Session,
+    room_ids: List[int],
+    start_time: datetime | None = None,
+    end_time: datetime | None = None,
+) -> List[RoomStatusResponse]:
+    """
+    Return a :class:`RoomStatusResponse` for each existing room in ``room_ids``.
+
+    Loads the rooms with one query and asks Bookings about all of them in a
+    single call, instead of one :func:`get_room_status` round-trip per room.
+    Unknown ids are left out of the result.
+    """
+    rooms = rooms_repository.get_rooms_by_ids(db, room_ids)
+    if not rooms:
+        return []
+
+    if start_time is None:
+        start_time = datetime.utcnow()
+    if end_time is None:
+        end_time = start_time + timedelta(minutes=5)
+    booked = bookings_client.are_rooms_currently_booked(
+        [room.id for room in rooms],
+        start_time=start_time,
+        end_time=end_time,
+    )
+    return [
+        RoomStatusResponse(
+            room_id=room.id,
+            static_status=room.status,
+            is_currently_booked=booked.get(room.id, False),
+        )
+        for room in rooms
+    ]
@@ -3,8 +3,9 @@ Pytest fixtures for the Rooms service.
 
 This module provides:
 
-* A dedicated SQLite test database.
-* A dependency override for ``get_db``.
+* An in-memory SQLite test database whose schema is created once per run.
+* A per-test ``db_session`` whose writes are rolled back afterwards, wired
+  in as the ``get_db`` dependency override (see :mod:`tests.sqlite_savepoint`).
 * A reusable :class:`fastapi.testclient.TestClient` instance.
 """
 
@@ -14,49 +15,52 @@ from typing import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from db.schema import Base
 from services.rooms.app.main import app
 from services.rooms.app import dependencies
+from services.rooms.app.service_layer import rooms_service
+from tests.sqlite_savepoint import create_savepoint_engine, savepoint_session
 
-TEST_DATABASE_URL = "sqlite:///./test_rooms.db"
-
-engine = create_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
+engine = create_savepoint_engine()
 TestingSessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
 )
 
 
-def _override_get_db():
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-# Apply the dependency override once for all tests in this package.
-app.dependency_overrides[dependencies.get_db] = _override_get_db
+@pytest.fixture(scope="session", autouse=True)
+def create_schema() -> Generator[None, None, None]:
+    """
+    Create the schema once for the whole run.
+    """
+    Base.metadata.create_all(bind=engine)
+    yield
 
 
 @pytest.fixture(autouse=True)
-def reset_database() -> Generator[None, None, None]:
+def db_session(create_schema: None) -> Generator[Session, None, None]:
     """
-    Recreate the database schema before each test function.
+    Serve every request of a test from one session that is rolled back after it.
     """
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    yield
+    with savepoint_session(engine, TestingSessionLocal) as session:
+
+        def _override_get_db() -> Generator[Session, None, None]:
+            yield session
+
+        app.dependency_overrides[dependencies.get_db] = _override_get_db
+        try:
+            yield session
+        finally:
+            app.dependency_overrides.pop(dependencies.get_db, None)
+            # Rooms cached during the test were rolled back with it.
+            rooms_service._invalidate_room_cache()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
     """
     Provide a FastAPI test client bound to the Rooms app.
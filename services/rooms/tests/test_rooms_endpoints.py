@@ -6,13 +6,16 @@ These tests verify:
 * Role-based access control for room creation.
 * Basic room listing and filtering.
 * The structure of the room-status response.
+* That room writes invalidate cached reads.
 """
 
 from __future__ import annotations
 
+import pytest
 from fastapi.testclient import TestClient
 
 from common.auth import create_access_token
+from services.rooms.app.service_layer import rooms_service
 
 
 def _make_token(user_id: int, role: str, username: str | None = None) -> str:
@@ -265,3 +268,78 @@ def test_regular_user_cannot_delete_room(client: TestClient) -> None:
         headers={"Authorization": f"Bearer {regular_token}"},
     )
     assert response.status_code in (401, 403)
+
+
+def test_room_writes_refresh_cached_reads(client: TestClient) -> None:
+    """
+    A read cached before an update or delete must not be served afterwards.
+    """
+    token = _make_token(user_id=1, role="facility_manager")
+    headers = {"Authorization": f"Bearer {token}"}
+    room_id = _create_room(client, token=token, name="CachedRoom", capacity=5)
+
+    assert client.get(f"/api/v1/rooms/{room_id}", headers=headers).json()["capacity"] == 5
+
+    response = client.put(f"/api/v1/rooms/{room_id}", json={"capacity": 12}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert client.get(f"/api/v1/rooms/{room_id}", headers=headers).json()["capacity"] == 12
+
+    assert client.delete(f"/api/v1/rooms/{room_id}", headers=headers).status_code == 204
+    assert client.get(f"/api/v1/rooms/{room_id}", headers=headers).status_code == 404
+
+
+def test_read_racing_a_write_does_not_cache_stale_room(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    A room loaded before a concurrent write's invalidation must not be cached.
+    """
+    token = _make_token(user_id=1, role="facility_manager")
+    headers = {"Authorization": f"Bearer {token}"}
+    room_id = _create_room(client, token=token, name="RacedRoom", capacity=5)
+
+    original_get = rooms_service.rooms_repository.get_room_by_id
+
+    def get_then_invalidate(db, rid):
+        room = original_get(db, rid)
+        # Another request commits a write while this read is in flight.
+        rooms_service._invalidate_room_cache()
+        return room
+
+    monkeypatch.setattr(rooms_service.rooms_repository, "get_room_by_id", get_then_invalidate)
+    assert client.get(f"/api/v1/rooms/{room_id}", headers=headers).status_code == 200
+    assert rooms_service._room_cache.get(room_id) is None
+
+
+def test_batch_room_status_asks_bookings_once(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    ``GET /rooms/status`` should cover every existing room with one Bookings call.
+    """
+    calls = []
+
+    def fake_are_rooms_currently_booked(room_ids, **_):
+        calls.append(list(room_ids))
+        return {room_id: room_id == room_ids[0] for room_id in room_ids}
+
+    monkeypatch.setattr(
+        rooms_service.bookings_client,
+        "are_rooms_currently_booked",
+        fake_are_rooms_currently_booked,
+    )
+    token = _make_token(user_id=1, role="facility_manager")
+    first = _create_room(client, token=token, name="BatchOne")
+    second = _create_room(client, token=token, name="BatchTwo", status="out_of_service")
+
+    response = client.get(
+        "/api/v1/rooms/status",
+        params={"ids": [second, first, 999_999]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200, response.text
+    assert calls == [[first, second]]
+    assert response.json() == [
+        {"room_id": first, "static_status": "active", "is_currently_booked": True},
+        {"room_id": second, "static_status": "out_of_service", "is_currently_booked": False},
+    ]
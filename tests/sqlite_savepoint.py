@@ -0,0 +1,60 @@
+"""
+In-memory SQLite engine and rolled-back test sessions, shared by the
+service test suites.
+
+Each test gets a session joined to an outer transaction that is rolled back
+afterwards. ``commit()`` calls made by the code under test only release a
+savepoint, so nothing a test writes outlives it.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+def create_savepoint_engine() -> Engine:
+    """
+    Return a pure in-memory SQLite engine that supports nested savepoints.
+
+    StaticPool hands every session the same single connection, so a schema
+    created once stays visible to all of them.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite manages BEGIN itself and mishandles SAVEPOINT; hand transaction
+    # control to SQLAlchemy so the per-test savepoints behave.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@contextmanager
+def savepoint_session(engine: Engine, session_factory: sessionmaker) -> Iterator[Session]:
+    """
+    Yield a session from ``session_factory`` whose writes are rolled back on exit.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = session_factory(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
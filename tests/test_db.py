@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.config import get_settings  # noqa: E402
+from common.db import engine_pool_options  # noqa: E402
+
+
+def test_sqlite_keeps_default_pool():
+    assert engine_pool_options("sqlite:///./test.db") == {}
+
+
+def test_server_database_gets_sized_lifo_pool():
+    settings = get_settings()
+    options = engine_pool_options("postgresql://user:pw@db:5432/app")
+    assert options["pool_size"] == settings.database_pool_size
+    assert options["max_overflow"] == settings.database_pool_overflow
+    assert options["pool_pre_ping"] is True
+    assert options["pool_use_lifo"] is True
@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.http_client import ServiceHTTPClient  # noqa: E402
+
+
+def test_clients_for_same_target_share_pool():
+    first = ServiceHTTPClient("http://pool-test:9001/", timeout=2.0, service_name="users")
+    second = ServiceHTTPClient("http://pool-test:9001", timeout=2.0, service_name="users")
+    assert first._build_client() is second._build_client()
+
+
+def test_clients_for_different_targets_do_not_share_pool():
+    a = ServiceHTTPClient("http://pool-test:9001", timeout=2.0)
+    b = ServiceHTTPClient("http://pool-test:9002", timeout=2.0)
+    c = ServiceHTTPClient("http://pool-test:9001", timeout=3.0)
+    assert a._build_client() is not b._build_client()
+    assert a._build_client() is not c._build_client()
@@ -0,0 +1,25 @@
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common.auth import build_jwt_validator, create_access_token, verify_access_token  # noqa: E402
+
+
+def test_validator_matches_verify_access_token():
+    token = create_access_token({"username": "val"}, subject="7", role="regular")
+    assert build_jwt_validator().decode(token) == verify_access_token(token)
+
+
+def test_validator_rejects_expired_and_tampered_tokens():
+    validator = build_jwt_validator()
+    expired = create_access_token(subject="7", role="regular", expires_delta=timedelta(minutes=-5))
+    with pytest.raises(RuntimeError):
+        validator.decode(expired)
+
+    token = create_access_token(subject="7", role="regular")
+    with pytest.raises(RuntimeError):
+        validator.decode(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from common import ttl_cache  # noqa: E402
+from common.ttl_cache import TTLCache  # noqa: E402
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10.0, maxsize=4)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1.0)
+
+    now[0] += 5.0
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    now[0] += 5.0
+    assert cache.get("a", "missing") == "missing"
+
+
+def test_full_cache_evicts_least_recently_used_entry():
+    cache = TTLCache(ttl=60.0, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_set_with_stale_generation_is_skipped():
+    cache = TTLCache(ttl=60.0, maxsize=4)
+    generation = cache.generation
+    cache.clear()  # a write invalidated the cache while the value was computed
+
+    assert cache.set("a", 1, generation=generation) == 1
+    assert cache.get("a") is None
+
+    cache.set("a", 2, generation=cache.generation)
+    assert cache.get("a") == 2
+
+
+def test_non_positive_ttl_is_not_stored():
+    cache = TTLCache(ttl=60.0, maxsize=4)
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a") is None